@@ -0,0 +1,105 @@
+"""Vectorised scoring of many resumes against the job taxonomy at once.
+
+The job database becomes a sparse skill-vocabulary x titles matrix W where
+W[s, t] is 1 if skill s counts towards title t's tech matches, plus 1 if it
+counts towards its soft matches (the same rule as JobIndex / match_skills_to_jobs).
+A batch of resumes becomes a sparse resumes x vocabulary count matrix R, so
+
+    total_matches = R @ W
+
+gives every resume's match count for every title in one sparse product. The
+percentages and top-k ranking are then computed per row on the non-zeros only.
+Results are identical to calling suggest_jobs() on each resume.
+
+Throughput target: >= 10,000 resumes/sec on one core for the bundled
+job_data.json (95 titles) with ~20 skills per resume, including top-5
+selection. Measure with `python bench.py batch-scoring`.
+"""
+
+import numpy as np
+from scipy import sparse
+
+from job_index import JobIndex
+
+
+class BatchScorer:
+    def __init__(self, job_database=None, job_index=None):
+        self.index = job_index or JobIndex(job_database)
+        self.titles = self.index.titles
+        self.total_required = np.asarray(self.index.total_required, dtype=np.float64)
+        self.vocabulary = {}
+        self._rows, self._cols, self._vals = [], [], []
+        self._matrix = None
+
+    def _add_to_vocabulary(self, skill):
+        column = len(self.vocabulary)
+        self.vocabulary[skill] = column
+        tech, soft = self.index.matching_titles(skill)
+        for title_id in tech:
+            self._rows.append(column)
+            self._cols.append(title_id)
+            self._vals.append(1)
+        for title_id in soft:
+            self._rows.append(column)
+            self._cols.append(title_id)
+            self._vals.append(1)
+        self._matrix = None
+
+    def skill_title_matrix(self):
+        """Sparse vocabulary x titles matrix of per-skill match counts (0, 1 or 2)."""
+        if self._matrix is None:
+            # Duplicate (row, col) pairs (tech + soft) are summed by the CSR conversion
+            self._matrix = sparse.csr_matrix(
+                (np.asarray(self._vals, dtype=np.int32), (self._rows, self._cols)),
+                shape=(len(self.vocabulary), len(self.titles))
+            )
+        return self._matrix
+
+    def resume_matrix(self, resumes):
+        """Sparse resumes x vocabulary matrix; repeated skills count repeatedly, as in the original loop."""
+        rows, cols = [], []
+        for row, skills in enumerate(resumes):
+            for skill in skills:
+                if skill not in self.vocabulary:
+                    self._add_to_vocabulary(skill)
+                rows.append(row)
+                cols.append(self.vocabulary[skill])
+        data = np.ones(len(rows), dtype=np.int32)
+        return sparse.csr_matrix((data, (rows, cols)), shape=(len(resumes), len(self.vocabulary)))
+
+    def score(self, resumes, top_k=5):
+        """Top-k [(title, (total_matches, match_percentage, req_percentage)), ...] per resume.
+
+        `resumes` is a list of skill lists, already normalised like preprocess_skills() output.
+        """
+        if not resumes:
+            return []
+        resume_matrix = self.resume_matrix(resumes)
+        totals = (resume_matrix @ self.skill_title_matrix()).tocsr()
+        totals.eliminate_zeros()
+        skill_counts = np.asarray([len(skills) for skills in resumes], dtype=np.float64)
+
+        results = []
+        for row in range(totals.shape[0]):
+            start, end = totals.indptr[row], totals.indptr[row + 1]
+            title_ids = totals.indices[start:end]
+            matches = totals.data[start:end].astype(np.float64)
+            if not len(title_ids):
+                results.append([])
+                continue
+            match_percentage = matches / skill_counts[row]
+            req_percentage = np.divide(
+                matches, self.total_required[title_ids],
+                out=np.zeros_like(matches), where=self.total_required[title_ids] > 0
+            )
+            # Highest (matches, match %, req %) first; ties keep database order, like a stable sort
+            order = np.lexsort((title_ids, -req_percentage, -match_percentage, -matches))[:top_k]
+            results.append([
+                (self.titles[title_ids[i]], (int(matches[i]), float(match_percentage[i]), float(req_percentage[i])))
+                for i in order
+            ])
+        return results
+
+    def suggest_jobs(self, skill_lists, top_k=5):
+        """Batch form of suggest_jobs(): recommended titles per resume."""
+        return [[title for title, _ in ranked] for ranked in self.score(skill_lists, top_k)]
@@ -0,0 +1,360 @@
+#!/usr/bin/env python3
+"""Backend benchmarks. Run from the backend/ directory:
+
+    python bench.py upload-overlap --pdf uploads/Resume.pdf --concurrency 4
+    python bench.py batch-scoring --resumes 20000
+    python bench.py skill-extraction resumes/*.pdf
+    python bench.py pdf-extraction resumes/*.pdf --workers 4
+    python bench.py fanout --titles 5 --locations Bangalore,Pune
+    python bench.py startup --budget 1.0
+
+Scrapes go to a local stand-in server (standin_server.py), never to naukri.com.
+"""
+
+import argparse
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+
+def _use_standin_server(latency=0.0):
+    from standin_server import start_standin_server
+    server, base_url = start_standin_server(latency=latency)
+    # Must be set before main/scraping are imported; they read their config at import time
+    os.environ["NAUKRI_BASE_URL"] = base_url
+    os.environ["SCRAPER_BACKEND"] = "http-only"
+    os.environ["SCRAPE_CACHE_DB"] = ""
+    os.environ["SCRAPE_CACHE_TTL"] = "0"
+    os.environ["JOB_STORE_DB"] = ""
+    os.environ["NAUKRI_RATE"] = "0"
+    # Every upload re-parses its PDF, so the CPU stage is part of what's measured
+    os.environ["ANALYSIS_CACHE_DB"] = ""
+    os.environ["ANALYSIS_CACHE_TTL"] = "0"
+    return server
+
+
+def bench_upload_overlap(pdf_path, concurrency=4, latency=0.5):
+    """Check that concurrent /upload requests overlap instead of queueing on the event loop.
+
+    Every request is sent through one TestClient, i.e. one event loop, just like a
+    single uvicorn worker. If any stage blocked the loop, N concurrent uploads would
+    take about N times as long as one.
+
+    Each request sends different bytes, so none is answered from the analysis cache.
+    On few cores the PDF stage serialises on the CPU either way, so the overlap
+    factor alone can't tell a blocked loop from a busy CPU; /healthz is polled
+    during the concurrent uploads, and its worst latency is how long the loop was
+    unavailable. Returns (overlap factor, worst /healthz latency in seconds).
+    """
+    server = _use_standin_server(latency)
+    from fastapi.testclient import TestClient
+    import main
+
+    with open(pdf_path, "rb") as f:
+        pdf = f.read()
+
+    sent = iter(range(1 << 30))
+
+    def upload(_):
+        # Trailing bytes after %%EOF are ignored by PDF parsers but change the content hash
+        body = pdf + b"\n%% upload %d\n" % next(sent)
+        started = time.perf_counter()
+        response = client.post("/upload", files={"file": ("resume.pdf", body, "application/pdf")})
+        response.raise_for_status()
+        return time.perf_counter() - started
+
+    def poll_health(done):
+        worst = 0.0
+        while not done:
+            started = time.perf_counter()
+            client.get("/healthz").raise_for_status()
+            worst = max(worst, time.perf_counter() - started)
+            time.sleep(0.01)
+        return worst
+
+    with TestClient(main.app) as client:
+        upload(0)  # warm-up: process pool start, spaCy load
+        single = upload(0)
+
+        done = []
+        with ThreadPoolExecutor(max_workers=1) as monitor:
+            loop_lag = monitor.submit(poll_health, done)
+            started = time.perf_counter()
+            with ThreadPoolExecutor(max_workers=concurrency) as executor:
+                latencies = list(executor.map(upload, range(concurrency)))
+            wall = time.perf_counter() - started
+            done.append(True)
+            loop_lag = loop_lag.result()
+
+    server.shutdown()
+    serial = single * concurrency
+    overlap = serial / wall if wall else 0.0
+    print(f"single upload:         {single:.2f}s")
+    print(f"{concurrency} concurrent uploads: {wall:.2f}s wall (max latency {max(latencies):.2f}s)")
+    print(f"overlap factor:        {overlap:.2f}x (1.0 = fully serialised, {concurrency}.0 = fully parallel)")
+    print(f"worst /healthz:        {loop_lag * 1000:.0f}ms while the uploads ran")
+    return overlap, loop_lag
+
+
+def bench_batch_scoring(resumes=20000, skills_per_resume=20, seed=0):
+    """Resumes/sec for BatchScorer against the bundled job_data.json (target: >= 10,000/sec)."""
+    import json
+    import random
+    from batch_scoring import BatchScorer
+
+    with open("job_data.json") as f:
+        job_database = json.load(f)
+    vocabulary = sorted({skill for job in job_database.values() for skill in job["tech"] + job["soft"]})
+    rng = random.Random(seed)
+    batch = [[rng.choice(vocabulary) for _ in range(skills_per_resume)] for _ in range(resumes)]
+
+    scorer = BatchScorer(job_database)
+    scorer.score(batch[:100])  # build the vocabulary matrix outside the timed region
+    started = time.perf_counter()
+    scorer.score(batch)
+    elapsed = time.perf_counter() - started
+    rate = resumes / elapsed
+    print(f"{resumes} resumes x {skills_per_resume} skills in {elapsed:.2f}s: {rate:,.0f} resumes/sec")
+    return rate
+
+
+# (label, SKILL_EXTRACTION_MODE, SPACY_PIPELINE); the first one is the reference output
+EXTRACTION_CONFIGS = [
+    ("spacy-full", "spacy", "full"),
+    ("spacy-slim", "spacy", "slim"),
+    ("phrase", "phrase", "slim"),
+    ("trie", "trie", "slim"),
+]
+
+
+def _extraction_run(texts_file, repeat):
+    """Child-process half of the skill-extraction bench; prints one JSON line."""
+    import json
+    import resource
+
+    with open(texts_file) as f:
+        texts = json.load(f)
+    started = time.perf_counter()
+    import main
+    common_skills = main.load_common_skills()
+    main.extract_resume_skills_batch(texts[:1])  # load models / compile matchers
+    load_time = time.perf_counter() - started
+
+    started = time.perf_counter()
+    for _ in range(repeat):
+        skills = [main.extract_skills(text, common_skills) for text in texts]
+    per_doc = (time.perf_counter() - started) / (repeat * len(texts))
+    print(json.dumps({
+        "skills": skills,
+        "load_s": load_time,
+        "ms_per_doc": per_doc * 1000,
+        "max_rss_mb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024,
+    }))
+
+
+def bench_skill_extraction(pdf_paths, repeat=5):
+    """Recall, per-document latency and peak memory of each extraction mode.
+
+    Each mode runs in a fresh interpreter so model memory is measured in isolation.
+    Recall is against the skills the full spaCy pipeline finds.
+    """
+    import json
+    import subprocess
+    import sys
+    import tempfile
+    from main import extract_text_from_pdf
+
+    texts = [extract_text_from_pdf(path) for path in pdf_paths]
+    texts = [text for text in texts if text]
+    with tempfile.NamedTemporaryFile("w", suffix=".json", delete=False) as f:
+        json.dump(texts, f)
+
+    results = {}
+    for label, mode, pipeline in EXTRACTION_CONFIGS:
+        env = dict(os.environ, SKILL_EXTRACTION_MODE=mode, SPACY_PIPELINE=pipeline, CPU_WORKERS="0")
+        out = subprocess.run(
+            [sys.executable, __file__, "skill-extraction-run", "--texts-file", f.name, "--repeat", str(repeat)],
+            env=env, capture_output=True, text=True
+        )
+        lines = [line for line in out.stdout.splitlines() if line.startswith("{")]
+        if out.returncode != 0 or not lines:
+            print(f"{label:<11} failed: {out.stderr.strip().splitlines()[-1] if out.stderr.strip() else out.returncode}")
+            continue
+        results[label] = json.loads(lines[-1])
+    os.unlink(f.name)
+
+    reference_label = next((label for label, _, _ in EXTRACTION_CONFIGS if label in results), None)
+    if reference_label is None:
+        return results
+    reference = [set(skills) for skills in results[reference_label]["skills"]]
+    print(f"{len(texts)} documents, recall against {reference_label}")
+    print(f"{'mode':<11} {'recall':>7} {'extra':>6} {'ms/doc':>8} {'load s':>7} {'max RSS MB':>11}")
+    for label, result in results.items():
+        found = [set(skills) for skills in result["skills"]]
+        hits = sum(len(f & r) for f, r in zip(found, reference))
+        total = sum(len(r) for r in reference)
+        extra = sum(len(f - r) for f, r in zip(found, reference))
+        recall = hits / total if total else 1.0
+        print(f"{label:<11} {recall:>7.1%} {extra:>6} {result['ms_per_doc']:>8.2f} {result['load_s']:>7.2f} {result['max_rss_mb']:>11.0f}")
+    return results
+
+
+def bench_pdf_extraction(pdf_paths, workers=4, repeat=3):
+    """Per-document and per-page extraction time of every installed PDF backend,
+    serially and with `workers` page-parallel processes."""
+    import pdf_text
+
+    for backend in pdf_text.available_backends():
+        for label, page_workers in (("serial", 0), (f"{workers} workers", workers)):
+            for path in pdf_paths:
+                try:
+                    pdf_text.extract_pdf_text(path, backend, workers=page_workers)  # warm-up
+                    runs = [pdf_text.extract_pdf_text(path, backend, workers=page_workers) for _ in range(repeat)]
+                except pdf_text.PdfExtractionError as e:
+                    print(f"{backend:<8} {label:<10} {os.path.basename(path)}: {e.code}: {e}")
+                    continue
+                best = min(runs, key=lambda result: result.seconds)
+                slowest = max(best.timings, key=lambda timing: timing[1], default=(None, 0.0))
+                print(f"{backend:<8} {label:<10} {os.path.basename(path)}: {best.page_count} pages, "
+                      f"{best.seconds * 1000:.1f} ms (slowest page {slowest[0]}: {slowest[1] * 1000:.1f} ms)")
+    pdf_text.close()
+
+
+def bench_fanout(titles=5, locations=("Bangalore", "Pune"), latency=0.3, pages=3, rate=None, time_budget=None):
+    """Wall time of a top-k x locations fan-out against one scrape of the top title.
+
+    Runs under the app's Naukri rate limit (NAUKRI_RATE unless `rate` is given; 0 = unlimited).
+    """
+    server = _use_standin_server(latency)
+    # _use_standin_server turns the limiter off; the fan-out's cost is mostly limiter wait
+    os.environ["NAUKRI_RATE"] = str(rate) if rate is not None else os.environ.get("BENCH_NAUKRI_RATE", "4")
+    import json
+    import scraping
+    from rate_limit import NAUKRI_BURST, NAUKRI_RATE
+
+    with open("job_data.json") as f:
+        keywords = list(json.load(f))[:titles]
+
+    started = time.perf_counter()
+    single = scraping.run_scraper(keywords[0], locations[0], 2, pages, use_cache=False)
+    single_wall = time.perf_counter() - started
+    if NAUKRI_RATE > 0:
+        # Start the fan-out with a full burst too, as a fresh upload would
+        time.sleep(NAUKRI_BURST / NAUKRI_RATE)
+
+    result = scraping.run_fanout(keywords, list(locations), 2, pages, time_budget=time_budget, use_cache=False)
+    fanout_wall = result["seconds"]
+    scraped = sum(search["jobs"] for search in result["searches"])
+    statuses = {}
+    for search in result["searches"]:
+        statuses[search["status"]] = statuses.get(search["status"], 0) + 1
+    limiter = scraping.NAUKRI_RATE_LIMITER.stats()["classes"]["interactive"]
+    # Let searches left running past the budget finish before shutting the server down
+    scraping.fanout_executor.shutdown(wait=True)
+    server.shutdown()
+    scraping.close()
+
+    print(f"rate limit:      {NAUKRI_RATE:g} req/s, burst {NAUKRI_BURST}" if NAUKRI_RATE > 0 else "rate limit:      off")
+    print(f"single scrape:   {len(single)} jobs in {single_wall:.2f}s")
+    print(f"fan-out {titles}x{len(locations)}:   {len(result['jobs'])} jobs ({scraped} before dedupe) in {fanout_wall:.2f}s, "
+          f"searches {statuses}")
+    print(f"limiter wait:    avg {limiter['avg_wait_seconds']:.2f}s, max {limiter['max_wait_seconds']:.2f}s "
+          f"over {limiter['requests']} requests")
+    print(f"slowdown:        {fanout_wall / single_wall:.2f}x for {titles * len(locations)}x the searches")
+    return fanout_wall / single_wall
+
+
+# Modules that must not be imported just by loading the app
+LAZY_MODULES = ("spacy", "PyPDF2", "selenium", "undetected_chromedriver", "pandas", "numpy", "scipy", "httpx")
+
+
+def bench_startup(budget=1.0, runs=5):
+    """Cold `import main` time in fresh interpreters, checked against a budget in seconds.
+
+    Also fails if any heavy subsystem in LAZY_MODULES gets imported eagerly.
+    """
+    import json
+    import subprocess
+    import sys
+
+    probe = (
+        "import json, sys, time; started = time.perf_counter(); import main; "
+        "elapsed = time.perf_counter() - started; "
+        f"print(json.dumps({{'elapsed': elapsed, 'eager': [m for m in {LAZY_MODULES!r} if m in sys.modules]}}))"
+    )
+    timings, eager = [], set()
+    for _ in range(runs):
+        out = subprocess.run([sys.executable, "-c", probe], capture_output=True, text=True, check=True)
+        result = json.loads(out.stdout.strip().splitlines()[-1])
+        timings.append(result["elapsed"])
+        eager.update(result["eager"])
+
+    timings.sort()
+    median = timings[len(timings) // 2]
+    print(f"import main: median {median * 1000:.0f} ms, min {timings[0] * 1000:.0f} ms over {runs} runs (budget {budget * 1000:.0f} ms)")
+    if eager:
+        print(f"eagerly imported heavy modules: {', '.join(sorted(eager))}")
+    print("breakdown: python -X importtime -c 'import main'")
+    return median <= budget and not eager
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Backend benchmarks")
+    sub = parser.add_subparsers(dest="bench", required=True)
+
+    overlap = sub.add_parser("upload-overlap", help="concurrent /upload requests overlap on one event loop")
+    overlap.add_argument("--pdf", default="uploads/Resume.pdf")
+    overlap.add_argument("--concurrency", type=int, default=4)
+    overlap.add_argument("--latency", type=float, default=0.5, help="stand-in server response delay (s)")
+
+    batch = sub.add_parser("batch-scoring", help="resumes/sec for vectorised batch scoring")
+    batch.add_argument("--resumes", type=int, default=20000)
+    batch.add_argument("--skills", type=int, default=20)
+
+    extraction = sub.add_parser("skill-extraction", help="recall/latency/memory of each skill extraction mode")
+    extraction.add_argument("pdfs", nargs="*", default=["uploads/Resume.pdf"])
+    extraction.add_argument("--repeat", type=int, default=5)
+
+    extraction_run = sub.add_parser("skill-extraction-run", help=argparse.SUPPRESS)
+    extraction_run.add_argument("--texts-file", required=True)
+    extraction_run.add_argument("--repeat", type=int, default=5)
+
+    pdf = sub.add_parser("pdf-extraction", help="per-page PDF extraction time by backend, serial vs parallel")
+    pdf.add_argument("pdfs", nargs="*", default=["uploads/Resume.pdf"])
+    pdf.add_argument("--workers", type=int, default=4)
+    pdf.add_argument("--repeat", type=int, default=3)
+
+    fanout = sub.add_parser("fanout", help="wall time of a multi-title, multi-location scrape fan-out")
+    fanout.add_argument("--titles", type=int, default=5)
+    fanout.add_argument("--locations", default="Bangalore,Pune")
+    fanout.add_argument("--latency", type=float, default=0.3, help="stand-in server response delay (s)")
+    fanout.add_argument("--rate", type=float, default=None, help="NAUKRI_RATE for this run (default 4, 0 = unlimited)")
+    fanout.add_argument("--budget", type=float, default=None, help="fan-out time budget (s), as NAUKRI_TIME_BUDGET")
+
+    startup = sub.add_parser("startup", help="cold import time of the app against a budget")
+    startup.add_argument("--budget", type=float, default=1.0, help="seconds")
+    startup.add_argument("--runs", type=int, default=5)
+
+    args = parser.parse_args()
+    if args.bench == "upload-overlap":
+        factor, _ = bench_upload_overlap(args.pdf, args.concurrency, args.latency)
+        # Anything well above 1x means requests ran side by side
+        raise SystemExit(0 if factor >= min(2.0, args.concurrency * 0.5) else 1)
+    elif args.bench == "batch-scoring":
+        rate = bench_batch_scoring(args.resumes, args.skills)
+        raise SystemExit(0 if rate >= 10000 else 1)
+    elif args.bench == "startup":
+        raise SystemExit(0 if bench_startup(args.budget, args.runs) else 1)
+    elif args.bench == "pdf-extraction":
+        bench_pdf_extraction(args.pdfs, args.workers, args.repeat)
+    elif args.bench == "fanout":
+        bench_fanout(args.titles, [l.strip() for l in args.locations.split(",") if l.strip()], args.latency,
+                     rate=args.rate, time_budget=args.budget)
+    elif args.bench == "skill-extraction":
+        bench_skill_extraction(args.pdfs, args.repeat)
+    elif args.bench == "skill-extraction-run":
+        _extraction_run(args.texts_file, args.repeat)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,132 @@
+import copy
+import json
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+
+
+class TieredCache:
+    """TTL + LRU cache with an in-process tier and an optional SQLite tier.
+
+    Keys are tuples of JSON-serialisable values; values must be JSON-serialisable.
+    The memory tier holds at most `max_entries` items and evicts least recently
+    used first. The SQLite tier (when `db_path` is set) survives restarts, holds
+    at most `max_disk_entries` rows and is consulted on a memory miss.
+    """
+
+    def __init__(self, ttl=3600, max_entries=256, db_path=None, max_disk_entries=10000, namespace="default"):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.max_disk_entries = max_disk_entries
+        self.namespace = namespace
+        self._memory = OrderedDict()
+        self._lock = threading.Lock()
+        self._db = None
+        self.counters = {"memory_hits": 0, "disk_hits": 0, "misses": 0, "evictions": 0, "expired": 0}
+        if db_path:
+            self._db = sqlite3.connect(db_path, check_same_thread=False)
+            self._db.execute("PRAGMA journal_mode=WAL")
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS cache ("
+                " namespace TEXT, key TEXT, value TEXT, expires_at REAL, last_access REAL,"
+                " PRIMARY KEY (namespace, key))"
+            )
+            self._db.execute("CREATE INDEX IF NOT EXISTS cache_last_access ON cache (namespace, last_access)")
+            self._db.commit()
+
+    @staticmethod
+    def make_key(*parts):
+        return json.dumps(parts, sort_keys=True, default=str)
+
+    def _count(self, name):
+        self.counters[name] += 1
+
+    def _remember(self, key, value, expires_at):
+        self._memory[key] = (value, expires_at)
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_entries:
+            self._memory.popitem(last=False)
+            self._count("evictions")
+
+    def get(self, key, default=None):
+        now = time.time()
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is not None:
+                value, expires_at = entry
+                if expires_at > now:
+                    self._memory.move_to_end(key)
+                    self._count("memory_hits")
+                    return copy.deepcopy(value)
+                del self._memory[key]
+                self._count("expired")
+
+            if self._db is not None:
+                row = self._db.execute(
+                    "SELECT value, expires_at FROM cache WHERE namespace = ? AND key = ?", (self.namespace, key)
+                ).fetchone()
+                if row is not None and row[1] > now:
+                    value = json.loads(row[0])
+                    self._db.execute(
+                        "UPDATE cache SET last_access = ? WHERE namespace = ? AND key = ?", (now, self.namespace, key)
+                    )
+                    self._db.commit()
+                    self._remember(key, value, row[1])
+                    self._count("disk_hits")
+                    return copy.deepcopy(value)
+                if row is not None:
+                    self._db.execute("DELETE FROM cache WHERE namespace = ? AND key = ?", (self.namespace, key))
+                    self._db.commit()
+                    self._count("expired")
+
+            self._count("misses")
+            return default
+
+    def set(self, key, value, ttl=None):
+        now = time.time()
+        expires_at = now + (self.ttl if ttl is None else ttl)
+        with self._lock:
+            self._remember(key, copy.deepcopy(value), expires_at)
+            if self._db is not None:
+                self._db.execute(
+                    "INSERT OR REPLACE INTO cache (namespace, key, value, expires_at, last_access) VALUES (?, ?, ?, ?, ?)",
+                    (self.namespace, key, json.dumps(value), expires_at, now)
+                )
+                self._prune_disk(now)
+                self._db.commit()
+
+    def _prune_disk(self, now):
+        self._db.execute("DELETE FROM cache WHERE namespace = ? AND expires_at <= ?", (self.namespace, now))
+        self._db.execute(
+            "DELETE FROM cache WHERE namespace = ? AND key IN ("
+            " SELECT key FROM cache WHERE namespace = ? ORDER BY last_access DESC LIMIT -1 OFFSET ?)",
+            (self.namespace, self.namespace, self.max_disk_entries)
+        )
+
+    def invalidate(self, key=None):
+        """Drop one key, or everything in this namespace when key is None."""
+        with self._lock:
+            if key is None:
+                self._memory.clear()
+            else:
+                self._memory.pop(key, None)
+            if self._db is not None:
+                if key is None:
+                    self._db.execute("DELETE FROM cache WHERE namespace = ?", (self.namespace,))
+                else:
+                    self._db.execute("DELETE FROM cache WHERE namespace = ? AND key = ?", (self.namespace, key))
+                self._db.commit()
+
+    def stats(self):
+        with self._lock:
+            stats = dict(self.counters, memory_entries=len(self._memory))
+        lookups = stats["memory_hits"] + stats["disk_hits"] + stats["misses"]
+        stats["hit_rate"] = (stats["memory_hits"] + stats["disk_hits"]) / lookups if lookups else 0.0
+        return stats
+
+    def close(self):
+        if self._db is not None:
+            with self._lock:
+                self._db.close()
+                self._db = None
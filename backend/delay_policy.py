@@ -0,0 +1,91 @@
+import random
+import time
+
+
+class NoDelay:
+    """Never pause; pacing comes entirely from waiting on the page."""
+
+    def next_delay(self):
+        return 0.0
+
+    def observe(self, elapsed):
+        pass
+
+    def pause(self):
+        delay = self.next_delay()
+        if delay > 0:
+            time.sleep(delay)
+        return delay
+
+
+class FixedDelay(NoDelay):
+    def __init__(self, seconds):
+        self.seconds = seconds
+
+    def next_delay(self):
+        return self.seconds
+
+
+class JitteredDelay(NoDelay):
+    def __init__(self, low, high):
+        self.low = low
+        self.high = high
+
+    def next_delay(self):
+        return random.uniform(self.low, self.high)
+
+
+class AdaptiveDelay(NoDelay):
+    """Pause for a fraction of the recently observed response time.
+
+    A slow site (likely under load, or starting to throttle us) gets longer
+    gaps; a fast one gets short ones. Response times are smoothed with an
+    exponentially weighted moving average.
+    """
+
+    def __init__(self, factor=0.5, min_delay=0.0, max_delay=5.0, smoothing=0.3, jitter=0.2):
+        self.factor = factor
+        self.min_delay = min_delay
+        self.max_delay = max_delay
+        self.smoothing = smoothing
+        self.jitter = jitter
+        self.average = None
+
+    def observe(self, elapsed):
+        if self.average is None:
+            self.average = elapsed
+        else:
+            self.average = self.smoothing * elapsed + (1 - self.smoothing) * self.average
+
+    def next_delay(self):
+        if self.average is None:
+            return self.min_delay
+        delay = self.factor * self.average * random.uniform(1 - self.jitter, 1 + self.jitter)
+        return max(self.min_delay, min(self.max_delay, delay))
+
+
+def default_delay_policy():
+    # Short gaps that grow if Naukri slows down
+    return AdaptiveDelay(factor=0.25, max_delay=2.0)
+
+
+def make_delay_policy(name, *args, **kwargs):
+    policies = {
+        "none": NoDelay,
+        "fixed": FixedDelay,
+        "jittered": JitteredDelay,
+        "adaptive": AdaptiveDelay,
+    }
+    if name not in policies:
+        raise ValueError(f"Unknown delay policy '{name}'. Expected one of: {', '.join(policies)}")
+    return policies[name](*args, **kwargs)
+
+
+def parse_delay_policy(spec):
+    """Policy from a setting such as "adaptive", "none", "fixed:1.5" or "jittered:0.5,2"."""
+    name, _, args = spec.partition(":")
+    name = name.strip().lower()
+    values = [float(value) for value in args.split(",") if value.strip()]
+    if name == "adaptive" and not values:
+        return default_delay_policy()
+    return make_delay_policy(name, *values)
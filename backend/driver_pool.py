@@ -0,0 +1,142 @@
+import threading
+from contextlib import contextmanager
+from queue import LifoQueue, Empty
+
+
+class PoolTimeout(Exception):
+    pass
+
+
+class DriverPool:
+    """Bounded pool of warm WebDriver sessions shared across requests.
+
+    At most `size` drivers exist at once. A driver is recycled (quit and
+    replaced on the next checkout) after `max_uses` checkouts or when it
+    fails its health check.
+    """
+
+    def __init__(self, factory, size=2, max_uses=25, checkout_timeout=120):
+        self.factory = factory
+        self.size = size
+        self.max_uses = max_uses
+        self.checkout_timeout = checkout_timeout
+        # LIFO so the most recently used (hottest) browser is handed out first
+        self._idle = LifoQueue()
+        self._slots = threading.BoundedSemaphore(size)
+        self._lock = threading.Lock()
+        self._uses = {}
+        self._closed = False
+        self.created = 0
+        self.recycled = 0
+
+    def _create(self):
+        driver = self.factory()
+        with self._lock:
+            self._uses[id(driver)] = 0
+            self.created += 1
+        return driver
+
+    def _discard(self, driver):
+        with self._lock:
+            self._uses.pop(id(driver), None)
+            self.recycled += 1
+        try:
+            driver.quit()
+        except Exception as e:
+            print(f"Error quitting pooled driver: {e}")
+
+    def _is_healthy(self, driver):
+        try:
+            driver.execute_script("return 1")
+            return len(driver.window_handles) > 0
+        except Exception:
+            return False
+
+    def _reset(self, driver):
+        # Leave the session the way a fresh one looks: a single tab, focused.
+        handles = driver.window_handles
+        for handle in handles[1:]:
+            driver.switch_to.window(handle)
+            driver.close()
+        driver.switch_to.window(handles[0])
+
+    def checkout(self, timeout=None):
+        if self._closed:
+            raise RuntimeError("DriverPool is closed")
+        timeout = self.checkout_timeout if timeout is None else timeout
+        if not self._slots.acquire(timeout=timeout):
+            raise PoolTimeout(f"No driver available within {timeout}s")
+        try:
+            while True:
+                try:
+                    driver = self._idle.get_nowait()
+                except Empty:
+                    driver = self._create()
+                    break
+                if self._is_healthy(driver):
+                    break
+                self._discard(driver)
+            with self._lock:
+                self._uses[id(driver)] += 1
+            return driver
+        except Exception:
+            self._slots.release()
+            raise
+
+    def checkin(self, driver, healthy=True):
+        try:
+            with self._lock:
+                uses = self._uses.get(id(driver), self.max_uses)
+            if self._closed or not healthy or uses >= self.max_uses:
+                self._discard(driver)
+                return
+            try:
+                self._reset(driver)
+            except Exception:
+                self._discard(driver)
+                return
+            self._idle.put(driver)
+        finally:
+            self._slots.release()
+
+    @contextmanager
+    def driver(self, timeout=None):
+        driver = self.checkout(timeout)
+        healthy = True
+        try:
+            yield driver
+        except Exception:
+            healthy = False
+            raise
+        finally:
+            self.checkin(driver, healthy=healthy)
+
+    def prewarm(self, count=None):
+        """Start up to `count` browsers ahead of the first request."""
+        count = self.size if count is None else min(count, self.size)
+        drivers = [self.checkout() for _ in range(count)]
+        for driver in drivers:
+            # warm-up checkouts don't count towards recycling
+            with self._lock:
+                self._uses[id(driver)] -= 1
+            self.checkin(driver)
+
+    def stats(self):
+        with self._lock:
+            live = len(self._uses)
+        return {
+            "size": self.size,
+            "live": live,
+            "idle": self._idle.qsize(),
+            "created": self.created,
+            "recycled": self.recycled,
+        }
+
+    def close(self):
+        self._closed = True
+        while True:
+            try:
+                driver = self._idle.get_nowait()
+            except Empty:
+                break
+            self._discard(driver)
@@ -1,6 +1,8 @@
 import re
 from collections import Counter
 
+from job_index import JobIndex, top_recommendations
+
 # Expanded database of job titles mapped to required tech stacks and soft skills
 job_database = {
     # Technology & Software Development
@@ -618,34 +620,19 @@ def preprocess_skills(skills_input):
     return skills
 
 
-def match_skills_to_jobs(skills):
-    """Match input skills to potential job titles"""
-    job_scores = {}
-
-    for job_title, requirements in job_database.items():
-        tech_matches = sum(1 for skill in skills if
-                           any(tech_skill in skill or skill in tech_skill for tech_skill in requirements["tech"]))
-        soft_matches = sum(1 for skill in skills if
-                           any(soft_skill in skill or skill in soft_skill for soft_skill in requirements["soft"]))
+job_index = JobIndex(job_database)
 
-        # Calculate a score based on matches and the total number of skills required
-        total_required = len(requirements["tech"]) + len(requirements["soft"])
-        total_matches = tech_matches + soft_matches
 
-        if total_matches > 0:
-            # Score is a combination of absolute matches and percentage of required skills
-            match_percentage = total_matches / len(skills) if skills else 0
-            req_percentage = total_matches / total_required if total_required else 0
-            job_scores[job_title] = (total_matches, match_percentage, req_percentage)
-
-    return job_scores
+def match_skills_to_jobs(skills):
+    """Match input skills to potential job titles"""
+    # Scores are (total_matches, match_percentage, req_percentage); only candidate titles are visited
+    return job_index.score(skills)
 
 
 def get_top_recommendations(job_scores, top_n=5):
     """Get top job recommendations based on scores"""
-    # Sort by total matches (index 0) in descending order
-    sorted_jobs = sorted(job_scores.items(), key=lambda x: (x[1][0], x[1][1], x[1][2]), reverse=True)
-    return sorted_jobs[:top_n]
+    # Top-k by (total matches, match %, requirement %) without sorting every title
+    return top_recommendations(job_scores, top_n)
 
 
 def suggest_jobs(skills_input):
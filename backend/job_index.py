@@ -0,0 +1,109 @@
+import heapq
+from functools import lru_cache
+
+TECH = 0
+SOFT = 1
+
+
+class JobIndex:
+    """Inverted index from requirement strings to the job titles that list them.
+
+    Scoring follows the original rule exactly: a skill counts towards a title's
+    tech (or soft) matches when it is a substring of one of the title's tech
+    (or soft) requirements, or one of those requirements is a substring of it.
+    Instead of testing every requirement of every title, each skill is resolved
+    to the requirement strings it matches through two lookups:
+
+    * requirements contained in the skill: every substring of the skill is
+      looked up in a dict of requirement strings;
+    * requirements containing the skill: posting lists of 1-, 2- and 3-character
+      grams narrow the candidates, which are then verified with `in`.
+
+    Only titles reachable from those requirements are scored.
+    """
+
+    def __init__(self, job_database, cache_size=4096):
+        self.titles = list(job_database)
+        self.total_required = []
+        self.requirements = []
+        self.requirement_ids = {}
+        self.postings = []  # requirement id -> ([tech title ids], [soft title ids])
+        self.grams = {}
+
+        for title_id, title in enumerate(self.titles):
+            requirements = job_database[title]
+            self.total_required.append(len(requirements["tech"]) + len(requirements["soft"]))
+            for kind, key in ((TECH, "tech"), (SOFT, "soft")):
+                for requirement in requirements[key]:
+                    posting = self.postings[self._requirement_id(requirement)][kind]
+                    if not posting or posting[-1] != title_id:
+                        posting.append(title_id)
+
+        self.max_requirement_len = max((len(r) for r in self.requirements), default=0)
+        self.matching_titles = lru_cache(maxsize=cache_size)(self._matching_titles)
+
+    def _requirement_id(self, requirement):
+        req_id = self.requirement_ids.get(requirement)
+        if req_id is None:
+            req_id = len(self.requirements)
+            self.requirement_ids[requirement] = req_id
+            self.requirements.append(requirement)
+            self.postings.append(([], []))
+            for n in (1, 2, 3):
+                for i in range(len(requirement) - n + 1):
+                    self.grams.setdefault(requirement[i:i + n], set()).add(req_id)
+        return req_id
+
+    def _requirements_containing(self, skill):
+        if len(skill) <= 3:
+            return self.grams.get(skill, set())
+        trigrams = sorted((self.grams.get(skill[i:i + 3], set()) for i in range(len(skill) - 2)), key=len)
+        candidates = set(trigrams[0])
+        for posting in trigrams[1:]:
+            candidates &= posting
+            if not candidates:
+                break
+        return {req_id for req_id in candidates if skill in self.requirements[req_id]}
+
+    def _requirements_contained_in(self, skill):
+        found = set()
+        for start in range(len(skill)):
+            for end in range(start + 1, min(len(skill), start + self.max_requirement_len) + 1):
+                req_id = self.requirement_ids.get(skill[start:end])
+                if req_id is not None:
+                    found.add(req_id)
+        return found
+
+    def _matching_titles(self, skill):
+        """(tech title ids, soft title ids) for titles the skill counts towards."""
+        tech, soft = set(), set()
+        for req_id in self._requirements_containing(skill) | self._requirements_contained_in(skill):
+            tech_titles, soft_titles = self.postings[req_id]
+            tech.update(tech_titles)
+            soft.update(soft_titles)
+        return frozenset(tech), frozenset(soft)
+
+    def score(self, skills):
+        """Same {title: (total_matches, match_percentage, req_percentage)} as match_skills_to_jobs."""
+        totals = {}
+        for skill in skills:
+            tech, soft = self.matching_titles(skill)
+            for title_id in tech:
+                totals[title_id] = totals.get(title_id, 0) + 1
+            for title_id in soft:
+                totals[title_id] = totals.get(title_id, 0) + 1
+
+        job_scores = {}
+        # Title order matters: ties in get_top_recommendations keep database order
+        for title_id in sorted(totals):
+            total_matches = totals[title_id]
+            total_required = self.total_required[title_id]
+            match_percentage = total_matches / len(skills) if skills else 0
+            req_percentage = total_matches / total_required if total_required else 0
+            job_scores[self.titles[title_id]] = (total_matches, match_percentage, req_percentage)
+        return job_scores
+
+
+def top_recommendations(job_scores, top_n=5):
+    # heapq.nlargest is documented equivalent to sorted(..., reverse=True)[:n], ties included
+    return heapq.nlargest(top_n, job_scores.items(), key=lambda x: (x[1][0], x[1][1], x[1][2]))
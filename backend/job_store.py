@@ -0,0 +1,167 @@
+import json
+import sqlite3
+import threading
+import time
+from urllib.parse import urlsplit, urlunsplit
+
+# Columns kept outside the JSON blob so they can be indexed / full-text searched
+FIELDS = ("title", "company", "location", "experience", "salary", "description", "posted_date", "skills")
+FTS_FIELDS = ("title", "company", "description", "skills")
+
+
+def normalize_url(url):
+    """Naukri job URLs carry per-search tracking parameters; the path alone identifies the job."""
+    parts = urlsplit(url.strip())
+    return urlunsplit((parts.scheme.lower(), parts.netloc.lower(), parts.path.rstrip("/"), "", ""))
+
+
+class JobStore:
+    """Every job the scrapers have seen, keyed by normalised job URL.
+
+    upsert() keeps first_seen from the first sighting and refreshes last_seen and
+    the job data on every later one. Title, company, description and skills are
+    full-text indexed (FTS5) for search(). Each search key also remembers which
+    URLs it returned and where, so an incremental crawl can serve known results
+    from here instead of re-fetching every page.
+    """
+
+    def __init__(self, db_path="jobs.sqlite3"):
+        self._db = sqlite3.connect(db_path, check_same_thread=False)
+        self._lock = threading.Lock()
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS jobs ("
+            " url TEXT PRIMARY KEY, " + ", ".join(f"{field} TEXT" for field in FIELDS) + ","
+            " data TEXT, first_seen REAL, last_seen REAL, times_seen INTEGER DEFAULT 1)"
+        )
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS search_results ("
+            " search TEXT, url TEXT, position INTEGER, last_seen REAL, PRIMARY KEY (search, url))"
+        )
+        self.fts = self._create_fts()
+        self._db.commit()
+
+    def _create_fts(self):
+        columns = ", ".join(FTS_FIELDS)
+        new_values = ", ".join(f"new.{field}" for field in FTS_FIELDS)
+        old_values = ", ".join(f"old.{field}" for field in FTS_FIELDS)
+        try:
+            self._db.execute(
+                f"CREATE VIRTUAL TABLE IF NOT EXISTS jobs_fts USING fts5({columns}, content='jobs', content_rowid='rowid')"
+            )
+        except sqlite3.OperationalError as e:
+            # SQLite built without FTS5: search() falls back to LIKE
+            print(f"FTS5 unavailable, job search will use LIKE: {e}")
+            return False
+        # External-content FTS table, kept in sync by triggers
+        self._db.executescript(f"""
+            CREATE TRIGGER IF NOT EXISTS jobs_ai AFTER INSERT ON jobs BEGIN
+                INSERT INTO jobs_fts (rowid, {columns}) VALUES (new.rowid, {new_values});
+            END;
+            CREATE TRIGGER IF NOT EXISTS jobs_ad AFTER DELETE ON jobs BEGIN
+                INSERT INTO jobs_fts (jobs_fts, rowid, {columns}) VALUES ('delete', old.rowid, {old_values});
+            END;
+            CREATE TRIGGER IF NOT EXISTS jobs_au AFTER UPDATE ON jobs BEGIN
+                INSERT INTO jobs_fts (jobs_fts, rowid, {columns}) VALUES ('delete', old.rowid, {old_values});
+                INSERT INTO jobs_fts (rowid, {columns}) VALUES (new.rowid, {new_values});
+            END;
+        """)
+        return True
+
+    def known_urls(self, urls, search=None):
+        """Normalised forms of the `urls` already in the store.
+
+        With `search`, only URLs recorded among that search's own results count.
+        """
+        normalized = list({normalize_url(url) for url in urls})
+        if not normalized:
+            return set()
+        placeholders = ", ".join("?" * len(normalized))
+        with self._lock:
+            if search is None:
+                rows = self._db.execute(f"SELECT url FROM jobs WHERE url IN ({placeholders})", normalized).fetchall()
+            else:
+                rows = self._db.execute(
+                    f"SELECT url FROM search_results WHERE search = ? AND url IN ({placeholders})",
+                    [search] + normalized
+                ).fetchall()
+        return {row[0] for row in rows}
+
+    def upsert(self, jobs, search=None, offset=0):
+        """Insert or refresh jobs; returns how many URLs were new.
+
+        With `search`, the jobs are also recorded as that search's results at
+        positions offset, offset + 1, ...
+        """
+        now = time.time()
+        new = 0
+        with self._lock:
+            for position, job in enumerate(jobs, start=offset):
+                url = normalize_url(job["url"])
+                values = [str(job.get(field, "")) for field in FIELDS]
+                cursor = self._db.execute(
+                    "UPDATE jobs SET " + ", ".join(f"{field} = ?" for field in FIELDS) + ","
+                    " data = ?, last_seen = ?, times_seen = times_seen + 1 WHERE url = ?",
+                    values + [json.dumps(job), now, url]
+                )
+                if cursor.rowcount == 0:
+                    self._db.execute(
+                        "INSERT INTO jobs (url, " + ", ".join(FIELDS) + ", data, first_seen, last_seen)"
+                        " VALUES (" + ", ".join("?" * (len(FIELDS) + 4)) + ")",
+                        [url] + values + [json.dumps(job), now, now]
+                    )
+                    new += 1
+                if search is not None:
+                    self._db.execute(
+                        "INSERT OR REPLACE INTO search_results (search, url, position, last_seen) VALUES (?, ?, ?, ?)",
+                        (search, url, position, now)
+                    )
+            self._db.commit()
+        return new
+
+    def search_results(self, search, limit=None):
+        """Stored jobs for a search key in result order; on equal positions the latest sighting wins."""
+        with self._lock:
+            rows = self._db.execute(
+                "SELECT jobs.data FROM search_results JOIN jobs ON jobs.url = search_results.url"
+                " WHERE search_results.search = ?"
+                " ORDER BY search_results.position, search_results.last_seen DESC LIMIT ?",
+                (search, -1 if limit is None else limit)
+            ).fetchall()
+        return [json.loads(row[0]) for row in rows]
+
+    def search(self, query, limit=20):
+        """Full-text search over title, company, description and skills, best matches first."""
+        with self._lock:
+            if self.fts:
+                sql = (
+                    "SELECT jobs.data, jobs.first_seen, jobs.last_seen FROM jobs_fts"
+                    " JOIN jobs ON jobs.rowid = jobs_fts.rowid"
+                    " WHERE jobs_fts MATCH ? ORDER BY rank LIMIT ?"
+                )
+                try:
+                    rows = self._db.execute(sql, (query, limit)).fetchall()
+                except sqlite3.OperationalError:
+                    # Not valid FTS5 query syntax ("c++", "node.js"); search for it as a phrase
+                    rows = self._db.execute(sql, ('"' + query.replace('"', '""') + '"', limit)).fetchall()
+            else:
+                pattern = f"%{query}%"
+                rows = self._db.execute(
+                    "SELECT data, first_seen, last_seen FROM jobs WHERE "
+                    + " OR ".join(f"{field} LIKE ?" for field in FTS_FIELDS)
+                    + " ORDER BY last_seen DESC LIMIT ?",
+                    [pattern] * len(FTS_FIELDS) + [limit]
+                ).fetchall()
+        return [dict(json.loads(data), first_seen=first_seen, last_seen=last_seen) for data, first_seen, last_seen in rows]
+
+    def stats(self):
+        with self._lock:
+            jobs, = self._db.execute("SELECT COUNT(*) FROM jobs").fetchone()
+            searches, = self._db.execute("SELECT COUNT(DISTINCT search) FROM search_results").fetchone()
+        return {"jobs": jobs, "searches": searches, "fts": self.fts}
+
+    def close(self):
+        with self._lock:
+            if self._db is not None:
+                self._db.close()
+                self._db = None
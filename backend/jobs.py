@@ -0,0 +1,88 @@
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
+QUEUED = "queued"
+RUNNING = "running"
+DONE = "done"
+FAILED = "failed"
+
+
+class JobManager:
+    """Runs submitted callables on a background worker pool and tracks their state.
+
+    Finished jobs are kept for `finished_ttl` seconds (and at most `max_jobs`
+    jobs are tracked overall) so their results can be polled.
+    """
+
+    def __init__(self, workers=2, max_jobs=1000, finished_ttl=3600):
+        self.workers = workers
+        self.max_jobs = max_jobs
+        self.finished_ttl = finished_ttl
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="job-worker")
+        self._jobs = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _prune(self):
+        now = time.time()
+        for job_id in list(self._jobs):
+            job = self._jobs[job_id]
+            finished = job["finished_at"]
+            if finished is not None and (now - finished > self.finished_ttl or len(self._jobs) > self.max_jobs):
+                del self._jobs[job_id]
+
+    def _run(self, job_id, fn, args, kwargs):
+        with self._lock:
+            job = self._jobs[job_id]
+            job["status"] = RUNNING
+            job["started_at"] = time.time()
+        try:
+            result = fn(*args, **kwargs)
+        except Exception as e:
+            print(f"Job {job_id} failed: {e}")
+            with self._lock:
+                job.update(status=FAILED, error=str(e), finished_at=time.time())
+            return
+        with self._lock:
+            job.update(status=DONE, result=result, finished_at=time.time())
+
+    def submit(self, fn, *args, meta=None, **kwargs):
+        job_id = uuid.uuid4().hex
+        with self._lock:
+            self._prune()
+            self._jobs[job_id] = {
+                "id": job_id,
+                "status": QUEUED,
+                "meta": meta or {},
+                "result": None,
+                "error": None,
+                "created_at": time.time(),
+                "started_at": None,
+                "finished_at": None,
+            }
+        self._executor.submit(self._run, job_id, fn, args, kwargs)
+        return job_id
+
+    def get(self, job_id):
+        with self._lock:
+            job = self._jobs.get(job_id)
+            return dict(job) if job is not None else None
+
+    def status(self, job_id):
+        job = self.get(job_id)
+        if job is None:
+            return None
+        job.pop("result")
+        return job
+
+    def stats(self):
+        with self._lock:
+            counts = {QUEUED: 0, RUNNING: 0, DONE: 0, FAILED: 0}
+            for job in self._jobs.values():
+                counts[job["status"]] += 1
+        return dict(counts, workers=self.workers)
+
+    def shutdown(self, wait=False):
+        self._executor.shutdown(wait=wait, cancel_futures=True)
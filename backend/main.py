@@ -1,27 +1,44 @@
-from fastapi import FastAPI, File, UploadFile
+from typing import List
+
+from fastapi import FastAPI, File, Query, UploadFile, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
-import shutil
+from fastapi.responses import StreamingResponse, JSONResponse
+import asyncio
+import functools
 import os
+import time
+import hashlib
+from contextlib import asynccontextmanager
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, TimeoutError as FutureTimeout
 import re
 import json
-import ssl
-import time
-import spacy
-import PyPDF2
-import certifi
-import urllib.request
-from collections import Counter
 
-import undetected_chromedriver as uc
-from selenium.webdriver.common.by import By
-from selenium.webdriver.common.keys import Keys
-import pandas as pd
-
-import naukri_scrapper as naukri  # Assuming this file exists in your backend folder
+# spaCy, PyPDF2, Selenium and numpy/scipy are imported where they're first used,
+# so importing this module (every worker start) stays cheap. See `python bench.py startup`.
+import scraping
+from precrawl import PRECRAWL_ENABLED, PrecrawlScheduler
+from cache import TieredCache
+import pdf_text
+from pdf_text import PdfExtractionError, extract_pdf_text, iter_pdf_pages
+from skill_matcher import flatten_text, get_skill_matcher, skill_variants
+from job_index import JobIndex, top_recommendations
+from jobs import JobManager, DONE, FAILED
 
 # ========== FASTAPI SETUP ==========
 
-app = FastAPI()
+@asynccontextmanager
+async def lifespan(app):
+    # Warm up in the background: /healthz answers immediately, /readyz once warm
+    warmup_task = asyncio.create_task(warm_up())
+    if PRECRAWL_ENABLED:
+        start_precrawl()
+    yield
+    warmup_task.cancel()
+    if precrawl_scheduler is not None:
+        precrawl_scheduler.stop(timeout=5)
+    close_scrapers()
+
+app = FastAPI(lifespan=lifespan)
 
 
 app.add_middleware(
@@ -32,37 +49,165 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Background workers for /jobs uploads; each one runs a whole Naukri scrape
+UPLOAD_JOB_WORKERS = int(os.environ.get("UPLOAD_JOB_WORKERS", "2"))
+
+job_manager = JobManager(workers=UPLOAD_JOB_WORKERS)
+
+# ========== WORKER POOLS ==========
+
+# Short blocking I/O (hashing, cache lookups) runs on threads; PDF parsing and spaCy run in
+# worker processes so they don't hold the GIL against the event loop.
+# CPU_WORKERS=0 runs the CPU stage on the I/O threads instead.
+# Naukri scrapes block for up to NAUKRI_TIME_BUDGET, so they get threads of their own:
+# uploads that are scraping never hold up another upload's analysis.
+IO_WORKERS = int(os.environ.get("IO_WORKERS", "8"))
+CPU_WORKERS = int(os.environ.get("CPU_WORKERS", str(min(4, os.cpu_count() or 1))))
+SCRAPE_WORKERS = int(os.environ.get("SCRAPE_WORKERS", "8"))
+
+io_executor = ThreadPoolExecutor(max_workers=IO_WORKERS, thread_name_prefix="io")
+scrape_executor = ThreadPoolExecutor(max_workers=SCRAPE_WORKERS, thread_name_prefix="scrape")
+cpu_executor = None
+
+def _init_cpu_worker():
+    # Pay for spacy.load once per worker process, not on its first resume.
+    # A failure here must not kill the worker; the model is loaded again on first use.
+    try:
+        warm_up_analysis()
+    except Exception as e:
+        print(f"Could not warm up worker: {e}")
+
+def get_cpu_executor():
+    global cpu_executor
+    if CPU_WORKERS <= 0:
+        return io_executor
+    if cpu_executor is None:
+        cpu_executor = ProcessPoolExecutor(max_workers=CPU_WORKERS, initializer=_init_cpu_worker)
+    return cpu_executor
+
+async def run_io(fn, *args, **kwargs):
+    return await asyncio.get_running_loop().run_in_executor(io_executor, functools.partial(fn, *args, **kwargs))
+
+async def run_scrape(fn, *args):
+    return await asyncio.get_running_loop().run_in_executor(scrape_executor, fn, *args)
+
+async def run_cpu(fn, *args):
+    return await asyncio.get_running_loop().run_in_executor(get_cpu_executor(), fn, *args)
+
+def close_scrapers():
+    job_manager.shutdown()
+    scraping.close()
+    pdf_text.close()
+    analysis_cache.close()
+    io_executor.shutdown(wait=False, cancel_futures=True)
+    scrape_executor.shutdown(wait=False, cancel_futures=True)
+    if cpu_executor is not None:
+        cpu_executor.shutdown(wait=False, cancel_futures=True)
+
 # ========== HELPERS ==========
 
-def clear_folder(upload_dir):
-    for filename in os.listdir(upload_dir):
-        file_path = os.path.join(upload_dir, filename)
-        if os.path.isfile(file_path):
-            os.remove(file_path)
+# Uploads are never written under their own name: Starlette spools each one to a private
+# temp file (in memory up to 1 MB), and the bytes are read once from there and parsed
+# from memory, so concurrent requests can't see or delete each other's files.
+UPLOAD_MAX_BYTES = int(os.environ.get("UPLOAD_MAX_BYTES", str(pdf_text.PDF_MAX_BYTES)))
+UPLOAD_MAX_FILES = int(os.environ.get("UPLOAD_MAX_FILES", "50"))
+
+async def read_upload(file):
+    """The uploaded file's bytes; 413 if it is over UPLOAD_MAX_BYTES."""
+    # Read one byte past the limit so an oversized upload is rejected without reading it all
+    data = await file.read(UPLOAD_MAX_BYTES + 1)
+    await file.close()
+    if len(data) > UPLOAD_MAX_BYTES:
+        raise HTTPException(status_code=413, detail=f"{file.filename} is larger than {UPLOAD_MAX_BYTES} bytes")
+    return data
 
 # ========== RESUME PROCESSING + JOB MATCHING ==========
 
+# "trie":   whole-token skill matching only (no spaCy).
+# "spacy":  additionally substring-match skills inside spaCy noun chunks, as the
+#           original extractor did; higher recall ("python" in "python3 developer")
+#           at the cost of a dependency parse per resume.
+# "phrase": spaCy PhraseMatcher over the skill vocabulary; tokenizer only, no parse.
+SKILL_EXTRACTION_MODES = ("trie", "spacy", "phrase")
+SKILL_EXTRACTION_MODE = os.environ.get("SKILL_EXTRACTION_MODE", "trie")
+SPACY_BATCH_SIZE = int(os.environ.get("SPACY_BATCH_SIZE", "16"))
+SPACY_N_PROCESS = int(os.environ.get("SPACY_N_PROCESS", "1"))
+# Upper bounds for the batch route's batch_size / n_process query parameters
+SPACY_MAX_BATCH_SIZE = int(os.environ.get("SPACY_MAX_BATCH_SIZE", "256"))
+SPACY_MAX_PROCESSES = CPU_WORKERS if CPU_WORKERS > 0 else (os.cpu_count() or 1)
+
+# "slim" loads only what doc.noun_chunks needs (tok2vec, tagger, attribute_ruler, parser);
+# "full" loads the whole en_core_web_sm pipeline.
+SPACY_PIPELINE = os.environ.get("SPACY_PIPELINE", "slim")
+SPACY_UNUSED_COMPONENTS = ["ner", "lemmatizer", "senter", "textcat"]
+
+if SKILL_EXTRACTION_MODE not in SKILL_EXTRACTION_MODES:
+    raise ValueError(f"Unknown SKILL_EXTRACTION_MODE '{SKILL_EXTRACTION_MODE}'. Expected one of: {', '.join(SKILL_EXTRACTION_MODES)}")
+
 nlp = None
 
 def load_spacy_model():
     global nlp
     if nlp is None:
+        import spacy
+        exclude = SPACY_UNUSED_COMPONENTS if SPACY_PIPELINE == "slim" else []
         try:
-            nlp = spacy.load("en_core_web_sm")
+            nlp = spacy.load("en_core_web_sm", exclude=exclude)
         except:
             import subprocess
             subprocess.check_call(["python", "-m", "spacy", "download", "en_core_web_sm"])
-            nlp = spacy.load("en_core_web_sm")
+            nlp = spacy.load("en_core_web_sm", exclude=exclude)
     return nlp
 
-def extract_text_from_pdf(pdf_path):
+phrase_matchers = {}
+
+def get_phrase_matcher(common_skills):
+    """(tokenizer-only nlp, PhraseMatcher) for a skill vocabulary, built once per vocabulary."""
+    key = tuple(common_skills)
+    if key not in phrase_matchers:
+        import spacy
+        from spacy.matcher import PhraseMatcher
+        blank = spacy.blank("en")
+        matcher = PhraseMatcher(blank.vocab, attr="LOWER")
+        for skill in common_skills:
+            # Also the spellings the trie accepts ("react js" for "react.js"), as flattened text has them
+            spellings = {skill} | {" ".join(tokens) for tokens in skill_variants(skill)}
+            matcher.add(skill, [blank.make_doc(spelling) for spelling in spellings])
+        phrase_matchers[key] = (blank, matcher)
+    return phrase_matchers[key]
+
+def phrase_text(text):
+    # spaCy keeps "\n" as a token and splits "problem-solving" into three, so a skill wrapped
+    # across PDF lines or hyphenated would never match a pattern; flatten both first
+    return flatten_text(text)
+
+def phrase_match_skills(doc, matcher):
+    return {doc.vocab.strings[match_id] for match_id, _, _ in matcher(doc)}
+
+def extract_text_from_pdf(pdf):
+    # Raises PdfExtractionError for unreadable PDFs and ones over the size/page/time limits
+    return extract_pdf_text(pdf).text
+
+# pdf_text only checks PDF_TIMEOUT between pages, so a single pathological page could
+# run unbounded; callers also stop waiting after PDF_TIMEOUT (0 = no limit). The worker
+# itself finishes the page in the background, it just no longer holds up the request.
+def extraction_timeout():
+    return PdfExtractionError(pdf_text.TIMEOUT, f"PDF extraction took longer than {pdf_text.PDF_TIMEOUT}s")
+
+def wait_extraction(future):
+    """future.result() within PDF_TIMEOUT; PdfExtractionError(TIMEOUT) after that."""
     try:
-        with open(pdf_path, 'rb') as file:
-            reader = PyPDF2.PdfReader(file)
-            return " ".join([page.extract_text() or "" for page in reader.pages])
-    except Exception as e:
-        print(f"Error extracting text from PDF: {e}")
-        return ""
+        return future.result(timeout=pdf_text.PDF_TIMEOUT or None)
+    except FutureTimeout:
+        future.cancel()
+        raise extraction_timeout() from None
+
+def extract_text_or_error(pdf):
+    """extract_text_from_pdf for batch use: returns the PdfExtractionError instead of raising it."""
+    try:
+        return extract_text_from_pdf(pdf)
+    except PdfExtractionError as e:
+        return e
 
 def preprocess_text(text):
     return re.sub(r'[\W_]+', ' ', text.lower()).strip()
@@ -74,51 +219,85 @@ def load_common_skills():
         "communication", "teamwork", "leadership", "problem solving", "adaptability"
     ]
 
+def noun_chunk_phrases(doc):
+    return set(chunk.text.lower().strip() for chunk in doc.noun_chunks if 1 <= len(chunk.text.split()) <= 3)
+
 def extract_skills_with_spacy(text):
     nlp = load_spacy_model()
-    doc = nlp(text)
-    return set(chunk.text.lower().strip() for chunk in doc.noun_chunks if 1 <= len(chunk.text.split()) <= 3)
+    return noun_chunk_phrases(nlp(text))
 
-def extract_skills(text, common_skills):
-    found_skills = set()
-    words = set(text.split())
-    found_skills.update(skill for skill in common_skills if skill in words)
-    potential_skills = extract_skills_with_spacy(text)
-    found_skills.update(skill for skill in common_skills if any(skill in ps for ps in potential_skills))
+def extract_skills_with_spacy_batch(texts, batch_size=None, n_process=None):
+    # nlp.pipe batches documents through the pipeline (and across processes when n_process > 1)
+    nlp = load_spacy_model()
+    docs = nlp.pipe(
+        texts,
+        batch_size=batch_size or SPACY_BATCH_SIZE,
+        n_process=n_process or SPACY_N_PROCESS
+    )
+    return [noun_chunk_phrases(doc) for doc in docs]
+
+def extract_skills(text, common_skills, potential_skills=None):
+    if SKILL_EXTRACTION_MODE == "phrase":
+        blank, matcher = get_phrase_matcher(common_skills)
+        return sorted(phrase_match_skills(blank.make_doc(phrase_text(text)), matcher))
+
+    # One pass over the text with a trie compiled once per vocabulary; matches whole tokens only
+    found_skills = get_skill_matcher(common_skills).find(text)
+    if SKILL_EXTRACTION_MODE == "spacy":
+        if potential_skills is None:
+            potential_skills = extract_skills_with_spacy(preprocess_text(text))
+        found_skills.update(skill for skill in common_skills if any(skill in ps for ps in potential_skills))
     return sorted(found_skills)
 
-def extract_resume_skills(pdf_path):
-    text = extract_text_from_pdf(pdf_path)
+def extract_resume_skills(pdf):
+    if SKILL_EXTRACTION_MODE == "trie":
+        # The trie matches page by page as the parser yields them; the other modes need the whole text
+        pages = (page.text for page in iter_pdf_pages(pdf))
+        return sorted(get_skill_matcher(load_common_skills()).find_in_texts(pages))
+    text = extract_text_from_pdf(pdf)
     if not text:
         print("No text found in the PDF.")
         return []
-    text = preprocess_text(text)
+    # The matcher tokenizes itself; preprocess_text would turn "c++" into "c"
     common_skills = load_common_skills()
     return extract_skills(text, common_skills)
 
+def extract_resume_skills_batch(texts, batch_size=None, n_process=None):
+    """Skills for many already-extracted resume texts; spaCy (if used) runs once via nlp.pipe."""
+    common_skills = load_common_skills()
+    if SKILL_EXTRACTION_MODE == "phrase":
+        blank, matcher = get_phrase_matcher(common_skills)
+        docs = blank.pipe((phrase_text(text) for text in texts), batch_size=batch_size or SPACY_BATCH_SIZE)
+        return [sorted(phrase_match_skills(doc, matcher)) for doc in docs]
+    if SKILL_EXTRACTION_MODE != "spacy":
+        return [extract_skills(text, common_skills) for text in texts]
+    chunk_sets = extract_skills_with_spacy_batch([preprocess_text(text) for text in texts], batch_size, n_process)
+    return [extract_skills(text, common_skills, chunks) for text, chunks in zip(texts, chunk_sets)]
+
 def preprocess_skills(skills_input):
     skills = re.split(r'[,;\n]+', skills_input.lower())
     return [skill.strip() for skill in skills if skill.strip()]
 
-f = open("job_data.json", "r")
-job_database = json.load(f)
+JOB_DATA_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "job_data.json")
+
+job_index = None
+
+def load_job_database():
+    with open(JOB_DATA_PATH, "r") as f:
+        return json.load(f)
+
+def get_job_index():
+    global job_index
+    if job_index is None:
+        job_index = JobIndex(load_job_database())
+    return job_index
 
 def match_skills_to_jobs(skills):
-    job_scores = {}
-    for job_title, requirements in job_database.items():
-        tech_matches = sum(1 for skill in skills if any(tech in skill or skill in tech for tech in requirements["tech"]))
-        soft_matches = sum(1 for skill in skills if any(soft in skill or skill in soft for soft in requirements["soft"]))
-        total_required = len(requirements["tech"]) + len(requirements["soft"])
-        total_matches = tech_matches + soft_matches
-        if total_matches > 0:
-            match_percentage = total_matches / len(skills) if skills else 0
-            req_percentage = total_matches / total_required if total_required else 0
-            job_scores[job_title] = (total_matches, match_percentage, req_percentage)
-    return job_scores
+    # Only titles sharing a requirement with some skill are touched; see JobIndex for the rule
+    return get_job_index().score(skills)
 
 def get_top_recommendations(job_scores, top_n=5):
-    sorted_jobs = sorted(job_scores.items(), key=lambda x: (x[1][0], x[1][1], x[1][2]), reverse=True)
-    return sorted_jobs[:top_n]
+    return top_recommendations(job_scores, top_n)
 
 def suggest_jobs(skills_input):
     if not skills_input.strip():
@@ -130,56 +309,427 @@ def suggest_jobs(skills_input):
     recommendations = get_top_recommendations(job_scores)
     return [title for title, _ in recommendations]
 
+batch_scorer = None
+
+def suggest_jobs_batch(skills_inputs, top_n=5):
+    """suggest_jobs() for many resumes at once via one sparse matrix product (see batch_scoring.py)."""
+    global batch_scorer
+    if batch_scorer is None:
+        # numpy/scipy are only needed for bulk re-ranking, so import them on first use
+        from batch_scoring import BatchScorer
+        batch_scorer = BatchScorer(job_index=get_job_index())
+    skill_lists = [preprocess_skills(skills_input) for skills_input in skills_inputs]
+    return batch_scorer.suggest_jobs(skill_lists, top_n)
+
+def warm_up_analysis():
+    """Load the model for the active extraction mode, compile the skill matcher, build the
+    job index, and push one dummy resume through the whole analysis path."""
+    common_skills = load_common_skills()
+    get_skill_matcher(common_skills)
+    if SKILL_EXTRACTION_MODE == "spacy":
+        load_spacy_model()
+    elif SKILL_EXTRACTION_MODE == "phrase":
+        get_phrase_matcher(common_skills)
+    get_job_index()
+    return suggest_jobs(",".join(extract_skills("Python developer with SQL, machine learning and communication skills", common_skills)))
+
 # ========== FINAL PROCESSING FUNCTION ==========
 
-def final_data(file_path):
-    skills = extract_resume_skills(file_path)
+def analyze_resume(pdf):
+    skills = extract_resume_skills(pdf)
     skill_string = ",".join(skills)
     recommended_jobs = suggest_jobs(skill_string)
+    return skills, recommended_jobs
 
-    if not recommended_jobs:
-        return {"skills": skills, "jobs": [], "naukri": []}
-
-    # Scrape jobs from Naukri for the top recommendation
-    scraper = naukri.NaukriSeleniumScraper(
-        headless=True,
-        disable_images=True
+def analyze_text(text):
+    """analyze_resume() for text that has already been extracted."""
+    if not text:
+        print("No text found in the PDF.")
+        return [], []
+    skills = extract_skills(text, load_common_skills())
+    return skills, suggest_jobs(",".join(skills))
+
+def analyze_resume_with_text(pdf):
+    text = extract_text_from_pdf(pdf)
+    skills, recommended_jobs = analyze_text(text)
+    return text, skills, recommended_jobs
+
+def analyze_texts_batch(texts, batch_size=None, n_process=None):
+    """(skills, jobs) for many extracted resume texts; spaCy (if used) runs once via nlp.pipe."""
+    skill_lists = extract_resume_skills_batch(texts, batch_size, n_process)
+    return [(skills, suggest_jobs(",".join(skills))) for skills in skill_lists]
+
+async def analyze_resumes_batch(pdfs, batch_size=None, n_process=None):
+    """Batch form of analyze_resume: one result per file, in order.
+
+    Each result is {"text": "...", "skills": [...], "jobs": [...]}, or {"error": "...", "code": ...} for
+    a file that could not be read, so one bad file doesn't fail the batch.
+
+    Every stage is awaited from the event loop through run_cpu. Nothing here blocks a
+    pool thread on another task in the same pool, which with CPU_WORKERS=0 (CPU stage
+    on the I/O threads) would deadlock once a few batches filled the pool.
+    """
+    # Text extraction is independent per file; run it across the CPU workers. Only as many
+    # files as there are workers are in flight, so PDF_TIMEOUT isn't spent queueing.
+    slots = asyncio.Semaphore(CPU_WORKERS if CPU_WORKERS > 0 else IO_WORKERS)
+
+    async def extract(pdf):
+        async with slots:
+            try:
+                return await asyncio.wait_for(run_cpu(extract_text_or_error, pdf), pdf_text.PDF_TIMEOUT or None)
+            except asyncio.TimeoutError:
+                return extraction_timeout()
+
+    texts = await asyncio.gather(*(extract(pdf) for pdf in pdfs))
+    readable = [i for i, text in enumerate(texts) if isinstance(text, str) and text]
+    # The skill stage (nlp.pipe in spacy mode) is CPU-bound too
+    analyses = await run_cpu(analyze_texts_batch, [texts[i] for i in readable], batch_size, n_process)
+
+    results = [
+        {"error": str(text), "code": text.code} if isinstance(text, PdfExtractionError)
+        else {"error": "No text found in the PDF."}
+        for text in texts
+    ]
+    for i, (skills, jobs) in zip(readable, analyses):
+        results[i] = {"text": texts[i], "skills": skills, "jobs": jobs}
+    return results
+
+# Scrape Naukri for the top NAUKRI_TOP_K recommendations in every NAUKRI_LOCATIONS location at
+# once (backend chosen by SCRAPER_BACKEND), giving up on searches slower than NAUKRI_TIME_BUDGET.
+# Incremental: stop paginating at the first page of already-stored jobs (see scraping.iter_scraper)
+NAUKRI_LOCATIONS = [l.strip() for l in os.environ.get("NAUKRI_LOCATIONS", "Bangalore").split(",") if l.strip()]
+NAUKRI_TOP_K = int(os.environ.get("NAUKRI_TOP_K", "5"))
+NAUKRI_TIME_BUDGET = float(os.environ.get("NAUKRI_TIME_BUDGET", "20"))
+if not NAUKRI_LOCATIONS:
+    raise ValueError("NAUKRI_LOCATIONS must name at least one location, e.g. 'Bangalore,Pune'")
+NAUKRI_SEARCH = {
+    "experience": 2, "pages": 3, "fetch_details": False,
+    "incremental": os.environ.get("SCRAPE_INCREMENTAL", "1") == "1"
+}
+
+# Keeps NAUKRI_SEARCH results for every job_data.json title in the scrape cache (PRECRAWL_ENABLED=1)
+precrawl_scheduler = None
+
+def start_precrawl():
+    global precrawl_scheduler
+    precrawl_scheduler = PrecrawlScheduler(
+        list(load_job_database()),
+        locations=NAUKRI_LOCATIONS,
+        pages=NAUKRI_SEARCH["pages"],
+        fetch_details=NAUKRI_SEARCH["fetch_details"]
     )
+    precrawl_scheduler.start()
 
-    scraped_jobs = scraper.run_scraper(
-        keyword=recommended_jobs[0],
-        location="Bangalore",
-        experience=2,
-        pages=3,
-        fetch_details=False
-    )
+def scrape_recommended_jobs(recommended_jobs):
+    """Listings for the top recommendations, merged into one ranked list tagged with source_title."""
+    titles = recommended_jobs[:NAUKRI_TOP_K]
+    if not titles:
+        return []
+    if precrawl_scheduler is not None:
+        for title in titles:
+            precrawl_scheduler.record_demand(title)
+    result = scraping.run_fanout(titles, NAUKRI_LOCATIONS, time_budget=NAUKRI_TIME_BUDGET, **NAUKRI_SEARCH)
+    missed = [f"{s['title']} in {s['location']}" for s in result["searches"] if s["status"] != "ok"]
+    if missed:
+        print(f"Naukri fan-out left out {len(missed)} searches after {result['seconds']:.1f}s: {', '.join(missed)}")
+    return result["jobs"]
+
+def iter_recommended_jobs(recommended_jobs):
+    # Streams page by page, so only the top recommendation in the first location
+    if not recommended_jobs:
+        return iter(())
+    if precrawl_scheduler is not None:
+        precrawl_scheduler.record_demand(recommended_jobs[0])
+    return scraping.iter_scraper(keyword=recommended_jobs[0], location=NAUKRI_LOCATIONS[0], **NAUKRI_SEARCH)
+
+def final_data(pdf):
+    skills, recommended_jobs = analyze_resume(pdf)
 
     return {
         "skills": skills,
         "jobs": recommended_jobs,
-        "naukri": scraped_jobs
+        "naukri": scrape_recommended_jobs(recommended_jobs)
     }
 
+# ========== ANALYSIS CACHE ==========
+
+# Results are keyed by the SHA-256 of the uploaded bytes, so re-uploads of the same
+# file skip parsing and matching. Extracted text is cached on its own (it doesn't
+# depend on the vocabulary or job data), so a vocabulary or job_data.json change
+# only re-runs matching. ANALYSIS_CACHE_DB="" keeps the cache in memory only.
+ANALYSIS_CACHE_TTL = float(os.environ.get("ANALYSIS_CACHE_TTL", str(7 * 24 * 3600)))
+ANALYSIS_CACHE_SIZE = int(os.environ.get("ANALYSIS_CACHE_SIZE", "1024"))
+ANALYSIS_CACHE_DB = os.environ.get("ANALYSIS_CACHE_DB", "")
+
+analysis_cache = TieredCache(
+    ttl=ANALYSIS_CACHE_TTL,
+    max_entries=ANALYSIS_CACHE_SIZE,
+    db_path=ANALYSIS_CACHE_DB or None,
+    namespace="analysis"
+)
+
+analysis_version = None
+
+def get_analysis_version():
+    """Digest of everything an analysis depends on besides the PDF: vocabulary, job data, mode
+    (and in spacy mode, which pipeline finds the noun chunks)."""
+    global analysis_version
+    if analysis_version is None:
+        digest = hashlib.sha256()
+        digest.update(json.dumps(sorted(load_common_skills())).encode())
+        with open(JOB_DATA_PATH, "rb") as f:
+            digest.update(f.read())
+        digest.update(SKILL_EXTRACTION_MODE.encode())
+        if SKILL_EXTRACTION_MODE == "spacy":
+            digest.update(SPACY_PIPELINE.encode())
+        analysis_version = digest.hexdigest()[:16]
+    return analysis_version
+
+def content_hash(pdf):
+    if isinstance(pdf, bytes):
+        return hashlib.sha256(pdf).hexdigest()
+    digest = hashlib.sha256()
+    with open(pdf, "rb") as f:
+        for block in iter(functools.partial(f.read, 1 << 16), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+def analysis_keys(digest):
+    text_key = TieredCache.make_key("text", digest, pdf_text.choose_backend())
+    return text_key, TieredCache.make_key("analysis", digest, get_analysis_version())
+
+async def analyze_resume_cached(pdf):
+    """analyze_resume(), memoized by file content."""
+    text_key, key = analysis_keys(await run_io(content_hash, pdf))
+    cached = await run_io(analysis_cache.get, key)
+    if cached is not None:
+        return cached["skills"], cached["jobs"]
+
+    text = await run_io(analysis_cache.get, text_key)
+    if text is None:
+        try:
+            text, skills, recommended_jobs = await asyncio.wait_for(
+                run_cpu(analyze_resume_with_text, pdf), pdf_text.PDF_TIMEOUT or None
+            )
+        except asyncio.TimeoutError:
+            raise extraction_timeout() from None
+        await run_io(analysis_cache.set, text_key, text)
+    else:
+        skills, recommended_jobs = await run_cpu(analyze_text, text)
+    await run_io(analysis_cache.set, key, {"skills": skills, "jobs": recommended_jobs})
+    return skills, recommended_jobs
+
+async def analyze_resumes_batch_cached(pdfs, batch_size=None, n_process=None):
+    """analyze_resumes_batch(), analysing only the files whose content isn't cached yet."""
+    keys = [analysis_keys(await run_io(content_hash, pdf)) for pdf in pdfs]
+    analyses = [await run_io(analysis_cache.get, key) for _, key in keys]
+    misses = [i for i, analysis in enumerate(analyses) if analysis is None]
+    if misses:
+        fresh = await analyze_resumes_batch([pdfs[i] for i in misses], batch_size, n_process)
+        for i, analysis in zip(misses, fresh):
+            analyses[i] = analysis
+            if "error" not in analysis:
+                text_key, key = keys[i]
+                await run_io(analysis_cache.set, text_key, analysis.pop("text"))
+                await run_io(analysis_cache.set, key, analysis)
+    return analyses
+
+# ========== WARM-UP + HEALTH ==========
+
+# Browsers to start in the scraper pool during warm-up (0 = start on first Selenium scrape)
+WARMUP_BROWSERS = int(os.environ.get("WARMUP_BROWSERS", "0"))
+
+warmup_state = {"ready": False, "started_at": None, "finished_at": None, "steps": {}}
+
+async def _warmup_step(name, fn, *args, required=True):
+    started = time.perf_counter()
+    try:
+        await fn(*args)
+        warmup_state["steps"][name] = {"ok": True, "seconds": round(time.perf_counter() - started, 3)}
+        return True
+    except Exception as e:
+        print(f"Warm-up step '{name}' failed: {e}")
+        warmup_state["steps"][name] = {"ok": False, "error": str(e), "required": required}
+        return not required
+
+async def warm_up():
+    warmup_state["started_at"] = time.time()
+    ok = await _warmup_step("analysis", run_io, warm_up_analysis)
+    if CPU_WORKERS > 0:
+        # One task per worker so every process starts and runs its initializer now
+        async def start_cpu_workers():
+            await asyncio.gather(*(run_cpu(warm_up_analysis) for _ in range(CPU_WORKERS)))
+        ok = await _warmup_step("cpu_workers", start_cpu_workers) and ok
+    if WARMUP_BROWSERS > 0:
+        await _warmup_step("browsers", run_io, scraping.driver_pool.prewarm, WARMUP_BROWSERS, required=False)
+    warmup_state["finished_at"] = time.time()
+    warmup_state["ready"] = ok
+
+@app.get("/healthz")
+def healthz():
+    return {"status": "ok"}
+
+@app.get("/readyz")
+def readyz():
+    if not warmup_state["ready"]:
+        return JSONResponse(status_code=503, content=dict(warmup_state, status="warming up" if warmup_state["finished_at"] is None else "failed"))
+    return dict(warmup_state, status="ready")
+
 # ========== FASTAPI ROUTE ==========
 
+@app.get("/stats")
+def scraper_stats():
+    return dict(
+        scraping.stats(),
+        jobs=job_manager.stats(),
+        analysis_cache=analysis_cache.stats(),
+        precrawl=precrawl_scheduler.stats() if precrawl_scheduler is not None else None
+    )
+
+@app.get("/listings")
+async def search_listings(q: str, limit: int = 20):
+    """Full-text search over every job scraped so far."""
+    if scraping.job_store is None:
+        raise HTTPException(status_code=404, detail="Job store is disabled (JOB_STORE_DB is empty)")
+    return {"query": q, "results": await run_io(scraping.job_store.search, q, limit)}
+
+async def analyze_upload(file):
+    pdf = await read_upload(file)
+    try:
+        return await analyze_resume_cached(pdf)
+    except PdfExtractionError as e:
+        raise HTTPException(status_code=413 if e.code == pdf_text.TOO_LARGE else 422, detail=e.to_dict())
+
 @app.post("/upload")
 async def upload_resume(file: UploadFile = File(...)):
-    upload_dir = "uploads"
-    os.makedirs(upload_dir, exist_ok=True)
-    clear_folder(upload_dir)
-    file_path = os.path.join(upload_dir, file.filename)
-    with open(file_path, "wb") as buffer:
-        shutil.copyfileobj(file.file, buffer)
-
-    # Final logic trigger
-    result = final_data(file_path)
+    skills, recommended_jobs = await analyze_upload(file)
+    naukri_jobs = await run_scrape(scrape_recommended_jobs, recommended_jobs)
 
     return {
         "message": "File processed successfully!",
         "filename": file.filename,
-        "skills": result["skills"],
-        "matched_jobs": result["jobs"],
-        "naukri_jobs": result["naukri"]
+        "skills": skills,
+        "matched_jobs": recommended_jobs,
+        "naukri_jobs": naukri_jobs
+    }
+
+# ---------- Batch variant of /upload ----------
+
+@app.post("/upload/batch")
+async def upload_resumes_batch(
+    files: List[UploadFile] = File(...),
+    batch_size: int = Query(None, ge=1, le=SPACY_MAX_BATCH_SIZE),
+    n_process: int = Query(None, ge=1, le=SPACY_MAX_PROCESSES)
+):
+    if len(files) > UPLOAD_MAX_FILES:
+        raise HTTPException(status_code=413, detail=f"At most {UPLOAD_MAX_FILES} files per batch")
+    pdfs = [await read_upload(file) for file in files]
+    analyses = await analyze_resumes_batch_cached(pdfs, batch_size, n_process)
+
+    # Resumes that share a top title share one scrape
+    titles = list({analysis["jobs"][0] for analysis in analyses if analysis.get("jobs")})
+    scrapes = await asyncio.gather(
+        *(run_scrape(scrape_recommended_jobs, [title]) for title in titles), return_exceptions=True
+    )
+    naukri_by_title = {}
+    for title, scraped in zip(titles, scrapes):
+        if isinstance(scraped, Exception):
+            print(f"Scrape for '{title}' failed: {scraped}")
+            scraped = []
+        naukri_by_title[title] = scraped
+
+    results = []
+    for file, analysis in zip(files, analyses):
+        if "error" in analysis:
+            results.append({"filename": file.filename, "error": analysis["error"], "code": analysis.get("code")})
+            continue
+        results.append({
+            "message": "File processed successfully!",
+            "filename": file.filename,
+            "skills": analysis["skills"],
+            "matched_jobs": analysis["jobs"],
+            "naukri_jobs": naukri_by_title.get(analysis["jobs"][0], []) if analysis["jobs"] else []
+        })
+
+    return {"results": results}
+
+# ---------- Streaming variant of /upload (NDJSON, one event per line) ----------
+
+def stream_events(pdf, filename):
+    yield {"event": "start", "filename": filename}
+
+    skills = wait_extraction(get_cpu_executor().submit(extract_resume_skills, pdf))
+    yield {"event": "skills", "skills": skills}
+
+    recommended_jobs = suggest_jobs(",".join(skills))
+    yield {"event": "matched_jobs", "matched_jobs": recommended_jobs}
+
+    total = 0
+    for page, jobs in iter_recommended_jobs(recommended_jobs):
+        total += len(jobs)
+        yield {"event": "naukri_jobs", "page": page, "naukri_jobs": jobs}
+
+    yield {"event": "done", "message": "File processed successfully!", "total_naukri_jobs": total}
+
+@app.post("/upload/stream")
+async def upload_resume_stream(file: UploadFile = File(...)):
+    pdf = await read_upload(file)
+
+    def ndjson():
+        try:
+            for event in stream_events(pdf, file.filename):
+                yield json.dumps(event) + "\n"
+        except Exception as e:
+            error = {"event": "error", "detail": str(e)}
+            if isinstance(e, PdfExtractionError):
+                error["code"] = e.code
+            yield json.dumps(error) + "\n"
+
+    return StreamingResponse(ndjson(), media_type="application/x-ndjson")
+
+# ---------- Submit / poll variant of /upload ----------
+
+@app.post("/jobs", status_code=202)
+async def submit_resume(file: UploadFile = File(...)):
+    skills, recommended_jobs = await analyze_upload(file)
+
+    # Only the Naukri scrape runs in the background; skills and matches are returned now
+    job_id = job_manager.submit(
+        scrape_recommended_jobs,
+        recommended_jobs,
+        meta={"filename": file.filename, "skills": skills, "matched_jobs": recommended_jobs}
+    )
+
+    return {
+        "job_id": job_id,
+        "status": job_manager.status(job_id)["status"],
+        "filename": file.filename,
+        "skills": skills,
+        "matched_jobs": recommended_jobs
+    }
+
+@app.get("/jobs/{job_id}")
+def job_status(job_id: str):
+    status = job_manager.status(job_id)
+    if status is None:
+        raise HTTPException(status_code=404, detail="Unknown job id")
+    return status
+
+@app.get("/jobs/{job_id}/result")
+def job_result(job_id: str):
+    job = job_manager.get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="Unknown job id")
+    if job["status"] == FAILED:
+        raise HTTPException(status_code=500, detail=f"Job failed: {job['error']}")
+    if job["status"] != DONE:
+        raise HTTPException(status_code=409, detail=f"Job is {job['status']}")
+
+    return {
+        "message": "File processed successfully!",
+        "filename": job["meta"]["filename"],
+        "skills": job["meta"]["skills"],
+        "matched_jobs": job["meta"]["matched_jobs"],
+        "naukri_jobs": job["result"]
     }
 
-f.close()
@@ -0,0 +1,236 @@
+import functools
+import html
+import importlib.util
+import json
+import re
+import threading
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlencode, urlparse
+
+# httpx is optional and imported on first client creation (it's slow to import);
+# HTTP/2 needs the h2 package on top of it.
+HTTPX_AVAILABLE = importlib.util.find_spec("httpx") is not None
+HTTP2_AVAILABLE = HTTPX_AVAILABLE and importlib.util.find_spec("h2") is not None
+
+try:
+    import orjson
+    _loads = orjson.loads
+except ImportError:
+    _loads = json.loads
+
+from rate_limit import DETAIL_RATE_LIMITER, INTERACTIVE, NAUKRI_RATE_LIMITER, RateLimitTimeout
+
+HEADERS = {
+    "appid": "109",
+    "systemid": "Naukri",
+    "accept": "application/json",
+    "user-agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/123.0.0.0 Safari/537.36",
+}
+
+
+class HttpScrapeError(Exception):
+    pass
+
+
+class _UrllibClient:
+    """Minimal stand-in for httpx.Client when httpx isn't installed (no keep-alive)."""
+
+    def __init__(self, timeout):
+        self.timeout = timeout
+
+    def get_json(self, url, params=None):
+        if params:
+            url = f"{url}?{urlencode(params)}"
+        request = urllib.request.Request(url, headers=HEADERS)
+        try:
+            with urllib.request.urlopen(request, timeout=self.timeout) as response:
+                return _loads(response.read())
+        # URLError covers connection failures; a read timeout raises a bare TimeoutError (also an OSError)
+        except (OSError, ValueError) as e:
+            raise HttpScrapeError(f"GET {url} failed: {e}") from e
+
+    def close(self):
+        pass
+
+
+class _HttpxClient:
+    def __init__(self, timeout, max_connections):
+        import httpx
+        self.errors = (httpx.HTTPError, ValueError)
+        limits = httpx.Limits(max_connections=max_connections, max_keepalive_connections=max_connections)
+        self.client = httpx.Client(http2=HTTP2_AVAILABLE, timeout=timeout, limits=limits, headers=HEADERS)
+
+    def get_json(self, url, params=None):
+        try:
+            response = self.client.get(url, params=params)
+            response.raise_for_status()
+            return _loads(response.content)
+        except self.errors as e:
+            raise HttpScrapeError(f"GET {url} failed: {e}") from e
+
+    def close(self):
+        self.client.close()
+
+
+def make_client(timeout=15, max_connections=8):
+    if HTTPX_AVAILABLE:
+        return _HttpxClient(timeout, max_connections)
+    return _UrllibClient(timeout)
+
+
+def _strip_html(value):
+    text = re.sub(r'<[^>]+>', ' ', value or "")
+    return re.sub(r'\s+', ' ', html.unescape(text)).strip()
+
+
+def _slugify(value):
+    return re.sub(r'[^a-z0-9]+', '-', str(value).lower()).strip('-')
+
+
+def parse_search_results(payload, base_url):
+    """Map the search API's jobDetails entries onto the scraper's job dict schema."""
+    if not isinstance(payload, dict) or "jobDetails" not in payload:
+        raise HttpScrapeError("Unexpected search response: no jobDetails")
+
+    jobs = []
+    for item in payload["jobDetails"]:
+        title = (item.get("title") or "").strip()
+        url = item.get("jdURL")
+        if not title or not url:
+            continue
+        if url.startswith("/"):
+            url = base_url + url
+
+        placeholders = {p.get("type"): (p.get("label") or "").strip() for p in item.get("placeholders", [])}
+        skills = [s.strip() for s in (item.get("tagsAndSkills") or "").split(",") if s.strip()]
+        description = _strip_html(item.get("jobDescription"))
+
+        jobs.append({
+            "title": title,
+            "url": url,
+            "company": (item.get("companyName") or "").strip() or "Not specified",
+            "location": placeholders.get("location") or "Not specified",
+            "experience": placeholders.get("experience") or "Not specified",
+            "salary": placeholders.get("salary") or "Not disclosed",
+            "description": description or "No description provided",
+            "posted_date": (item.get("footerPlaceholderLabel") or "").replace("Posted: ", "").strip() or "Not specified",
+            "skills": ", ".join(skills) if skills else "Not specified",
+            "job_id": str(item.get("jobId", "")),
+        })
+    return jobs
+
+
+def parse_job_details(payload):
+    details = (payload or {}).get("jobDetails") or {}
+    company = details.get("companyDetail") or {}
+    key_skills = details.get("keySkills") or {}
+    skills = [s.get("label", "").strip() for group in ("preferred", "other") for s in key_skills.get(group, [])]
+    role = ", ".join(v for v in (details.get("roleCategory"), details.get("functionalArea")) if v)
+    return {
+        "full_description": _strip_html(details.get("description")) or "Not provided",
+        "role": role or "Not specified",
+        "company_details": _strip_html(company.get("details")) or "Not provided",
+        "required_skills": ", ".join(s for s in skills if s) or "Not specified",
+    }
+
+
+class NaukriHttpScraper:
+    """Browserless backend: talks to Naukri's JSON endpoints over a pooled HTTP client.
+
+    Implements the same run_scraper contract and job schema as NaukriSeleniumScraper.
+    `base_url` can point at a local stand-in server (see standin_server.py).
+    """
+
+    def __init__(self, base_url="https://www.naukri.com", timeout=15, max_connections=8, client=None):
+        self.base_url = base_url.rstrip("/")
+        self.timeout = timeout
+        self.max_connections = max_connections
+        self.client = client or make_client(timeout, max_connections)
+        self.rate_limiter = DETAIL_RATE_LIMITER
+        self.global_limiter = NAUKRI_RATE_LIMITER
+
+    def close(self):
+        self.client.close()
+
+    def search_page(self, keyword, location=None, experience=None, page=1, priority=INTERACTIVE):
+        params = {
+            "noOfResults": 20,
+            "urlType": "search_by_key_loc" if location else "search_by_keyword",
+            "searchType": "adv",
+            "keyword": keyword,
+            "pageNo": page,
+            "k": keyword,
+            "seoKey": f"{_slugify(keyword)}-jobs" + (f"-in-{_slugify(location)}" if location else ""),
+            "src": "jobsearchDesk",
+        }
+        if location:
+            params["location"] = location
+            params["l"] = location
+        if experience is not None and str(experience) != "":
+            params["experience"] = str(experience).split('-')[0].strip()
+        if not self.global_limiter.acquire(priority, timeout=self.timeout):
+            raise RateLimitTimeout(f"Rate limit wait exceeded for search page {page}")
+        payload = self.client.get_json(f"{self.base_url}/jobapi/v3/search", params)
+        return parse_search_results(payload, self.base_url)
+
+    def job_details(self, job, priority=INTERACTIVE):
+        job_id = job.get("job_id")
+        if not job_id:
+            return {}
+        if not self.rate_limiter.acquire(urlparse(self.base_url).netloc, timeout=self.timeout):
+            return {}
+        if not self.global_limiter.acquire(priority, timeout=self.timeout):
+            return {}
+        try:
+            return parse_job_details(self.client.get_json(f"{self.base_url}/jobapi/v4/job/{job_id}"))
+        except HttpScrapeError as e:
+            print(f"Error fetching job details: {e}")
+            return {}
+
+    def iter_pages(self, keyword, location=None, experience=None, pages=3, fetch_details=False, workers=None,
+                   priority=INTERACTIVE, start=1):
+        """Yield (page_number, jobs) for pages start..pages in order; up to `workers` are requested concurrently.
+
+        Raises HttpScrapeError if a search page fails, so callers can fall back, and
+        RateLimitTimeout if one waits too long for the shared limiter.
+        """
+        workers = max(1, min(pages - start + 1, workers or self.max_connections))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = [
+                executor.submit(self.search_page, keyword, location, experience, page, priority)
+                for page in range(start, pages + 1)
+            ]
+            try:
+                for page, future in enumerate(futures, start=start):
+                    jobs = future.result()
+                    if fetch_details and jobs:
+                        details_iter = executor.map(functools.partial(self.job_details, priority=priority), jobs)
+                        for job, details in zip(jobs, details_iter):
+                            job.update(details)
+                    # job_id is only needed to look up details; keep the schema identical to the Selenium backend
+                    for job in jobs:
+                        job.pop("job_id", None)
+                    yield page, jobs
+            finally:
+                for future in futures:
+                    future.cancel()
+
+    def run_scraper(self, keyword, location=None, experience=None, pages=3, fetch_details=False, priority=INTERACTIVE):
+        """Raises HttpScrapeError if the search itself fails, so callers can fall back."""
+        all_jobs = []
+        for _, jobs in self.iter_pages(keyword, location, experience, pages, fetch_details, priority=priority):
+            all_jobs.extend(jobs)
+        print(f"Total jobs collected: {len(all_jobs)}")
+        return all_jobs
+
+
+_shared_lock = threading.Lock()
+_shared = {}
+
+def get_shared_scraper(base_url="https://www.naukri.com"):
+    """One scraper (and so one connection pool) per base URL for the whole process."""
+    with _shared_lock:
+        if base_url not in _shared:
+            _shared[base_url] = NaukriHttpScraper(base_url=base_url)
+        return _shared[base_url]
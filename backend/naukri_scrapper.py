@@ -1,10 +1,12 @@
 #!/usr/bin/env python3
 
 import time
-import random
 import csv
 import os
+import re
 from datetime import datetime
+from urllib.parse import urlencode, urlparse
+from concurrent.futures import ThreadPoolExecutor
 
 from selenium import webdriver
 from selenium.webdriver.chrome.service import Service
@@ -13,50 +15,257 @@ from selenium.webdriver.common.by import By
 from selenium.webdriver.common.keys import Keys
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import TimeoutException, NoSuchElementException, StaleElementReferenceException
+from selenium.common.exceptions import TimeoutException, NoSuchElementException, StaleElementReferenceException, JavascriptException
 from webdriver_manager.chrome import ChromeDriverManager
 
+from delay_policy import default_delay_policy
+from rate_limit import DETAIL_RATE_LIMITER, INTERACTIVE, NAUKRI_RATE_LIMITER, RateLimitTimeout
+
+JOB_CARD_CLASS = "styles_job-listing-container__OCfZC"
+
+# Where each field of a job card lives. Update this when Naukri renames its classes.
+#   selector: CSS selector relative to the card
+#   attr:     "text" (rendered text) or an attribute/property name such as "href"
+#   items:    collect every match of this selector inside `selector` and join them
+#   strip:    prefix to drop from the value
+#   default:  value when the element is missing; cards without a `required` field are skipped
+CARD_FIELDS = {
+    "title": {"selector": "a.title", "attr": "text", "required": True},
+    "url": {"selector": "a.title", "attr": "href", "required": True},
+    "company": {"selector": "div.row2 a.comp-name", "default": "Not specified"},
+    "location": {"selector": "span.locWdth", "default": "Not specified"},
+    "experience": {"selector": ".expwdth", "default": "Not specified"},
+    "salary": {"selector": "sal-wrap span span", "default": "Not disclosed"},
+    "description": {"selector": ".job-desc", "default": "No description provided"},
+    "posted_date": {"selector": "span[class*='jobDate']", "strip": "Posted: ", "default": "Not specified"},
+    "skills": {"selector": ".tags-gt", "items": ".ellipsis", "join": ", ", "default": "Not specified"},
+}
+
+# Reads every card on the page in one WebDriver round trip.
+EXTRACT_CARDS_JS = """
+const cardClass = arguments[0];
+const fields = arguments[1];
+const read = (el, attr) => {
+    if (attr === "text") return (el.innerText || "").trim();
+    const value = el[attr] !== undefined ? el[attr] : el.getAttribute(attr);
+    return value == null ? null : String(value);
+};
+const jobs = [];
+for (const card of document.getElementsByClassName(cardClass)) {
+    const job = {};
+    let complete = true;
+    for (const [name, spec] of Object.entries(fields)) {
+        const el = card.querySelector(spec.selector);
+        let value = null;
+        if (el && spec.items) {
+            value = Array.from(el.querySelectorAll(spec.items), item => (item.innerText || "").trim()).join(spec.join || ", ");
+        } else if (el) {
+            value = read(el, spec.attr || "text");
+            if (value !== null && spec.strip) value = value.split(spec.strip).join("");
+        }
+        if (value === null) {
+            if (spec.required) { complete = false; break; }
+            value = spec.default;
+        }
+        job[name] = value;
+    }
+    if (complete) jobs.push(job);
+}
+return jobs;
+"""
+
+
+def build_chrome_options(headless=True, disable_images=True):
+    chrome_options = Options()
+    if headless:
+        chrome_options.add_argument("--headless")
+    chrome_options.add_argument("--window-size=1920,1080")
+    chrome_options.add_argument("--disable-notifications")
+    chrome_options.add_argument("--disable-popup-blocking")
+    chrome_options.add_argument("--disable-infobars")
+    chrome_options.add_argument("--disable-extensions")
+    chrome_options.add_argument("--disable-gpu")
+    chrome_options.add_argument("--no-sandbox")
+    chrome_options.add_argument("--disable-dev-shm-usage")
+    
+    chrome_options.add_argument("--user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/123.0.0.0 Safari/537.36")
+    
+    if disable_images:
+        chrome_prefs = {"profile.managed_default_content_settings.images": 2}
+        chrome_options.add_experimental_option("prefs", chrome_prefs)
+    return chrome_options
+
+
+_driver_path = None
+
+def create_driver(headless=True, disable_images=True):
+    # ChromeDriverManager hits the network to resolve the driver; do it once per process.
+    global _driver_path
+    if _driver_path is None:
+        _driver_path = ChromeDriverManager().install()
+    return webdriver.Chrome(service=Service(_driver_path), options=build_chrome_options(headless, disable_images))
+
+
+def _slugify(value):
+    return re.sub(r'[^a-z0-9]+', '-', str(value).lower()).strip('-')
+
+
+def build_search_url(keyword, location=None, experience=None, page=1, base_url="https://www.naukri.com"):
+    """Direct URL of a search result page, e.g. /python-developer-jobs-in-bangalore-2?k=...&l=..."""
+    path = f"{_slugify(keyword)}-jobs"
+    if location:
+        path += f"-in-{_slugify(location)}"
+    if page > 1:
+        path += f"-{page}"
+    
+    params = {"k": keyword}
+    if location:
+        params["l"] = location
+    if experience is not None and str(experience) != "":
+        # Naukri's query string takes a single year count; use the lower bound of a range
+        params["experience"] = str(experience).split('-')[0].strip()
+    return f"{base_url}/{path}?{urlencode(params)}"
+
+
+def fetch_details_concurrently(pool, jobs, concurrency=4, timeout=15, rate_limiter=None, priority=INTERACTIVE,
+                               delay_policy=None):
+    """Fill in detail fields for every job using up to `concurrency` pooled drivers.
+
+    Each job gets at most `timeout` seconds; jobs that fail or time out are left
+    without details. Jobs are updated in place and returned in their original order.
+    """
+    rate_limiter = rate_limiter or DETAIL_RATE_LIMITER
+    delay_policy = delay_policy if delay_policy is not None else default_delay_policy()
+    
+    def fetch(job):
+        if 'url' not in job:
+            return {}
+        if not rate_limiter.acquire(urlparse(job['url']).netloc, timeout=timeout):
+            print(f"Rate limit wait exceeded for {job['url']}")
+            return {}
+        # Token before checkout: a driver never sits idle (or gets recycled) waiting on the limiter
+        delay_policy.pause()
+        if not NAUKRI_RATE_LIMITER.acquire(priority, timeout=timeout):
+            print(f"Rate limit wait exceeded for {job['url']}")
+            return {}
+        try:
+            with pool.driver(timeout=timeout) as driver:
+                try:
+                    scraper = NaukriSeleniumScraper(driver=driver, priority=priority, delay_policy=delay_policy)
+                    started = time.monotonic()
+                    details = scraper.load_job_details(job['url'], timeout, throttle=False)
+                    delay_policy.observe(time.monotonic() - started)
+                    return details
+                except TimeoutException:
+                    # A slow page is not a broken browser; hand the driver back for reuse.
+                    print(f"Timed out after {timeout}s fetching details for {job['url']}")
+                    return {}
+        except Exception as e:
+            print(f"Error fetching job details for {job['url']}: {e}")
+            return {}
+    
+    with ThreadPoolExecutor(max_workers=max(1, concurrency)) as executor:
+        for job, details in zip(jobs, executor.map(fetch, jobs)):
+            job.update(details)
+    return jobs
+
+
+def iter_pages_concurrently(pool, keyword, location=None, experience=None, pages=3, fetch_details=False, workers=None,
+                            detail_concurrency=None, detail_timeout=15, priority=INTERACTIVE, start=1, delay_policy=None):
+    """Fetch result pages start..pages in parallel on pooled drivers; yield (page, jobs) in page order.
+
+    One `delay_policy` paces every page load (and detail load), so what it learns
+    about Naukri's response times carries across pages and drivers.
+    """
+    workers = max(1, min(pages - start + 1, workers or pool.size))
+    delay_policy = delay_policy if delay_policy is not None else default_delay_policy()
+    
+    def fetch(page):
+        delay_policy.pause()
+        # Token before checkout: a driver never sits idle (or gets recycled) waiting on the limiter
+        if not NAUKRI_RATE_LIMITER.acquire(priority, timeout=15):
+            print(f"Rate limit wait exceeded for page {page}")
+            return []
+        try:
+            with pool.driver() as driver:
+                scraper = NaukriSeleniumScraper(driver=driver, priority=priority, delay_policy=delay_policy)
+                return scraper.scrape_page(keyword, location, experience, page, throttle=False)
+        except Exception as e:
+            print(f"Error scraping page {page}: {e}")
+            return []
+    
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        futures = [executor.submit(fetch, page) for page in range(start, pages + 1)]
+        try:
+            for page, future in enumerate(futures, start=start):
+                jobs = future.result()
+                if fetch_details and jobs:
+                    fetch_details_concurrently(pool, jobs, concurrency=detail_concurrency or workers, timeout=detail_timeout,
+                                               priority=priority, delay_policy=delay_policy)
+                yield page, jobs
+        finally:
+            for future in futures:
+                future.cancel()
+
+
+def scrape_pages_concurrently(pool, keyword, location=None, experience=None, pages=3, fetch_details=False, workers=None,
+                              detail_concurrency=None, detail_timeout=15, priority=INTERACTIVE, delay_policy=None):
+    """Fetch result pages 1..pages in parallel on pooled drivers, merged in page order."""
+    all_jobs = []
+    for _, jobs in iter_pages_concurrently(pool, keyword, location, experience, pages, fetch_details, workers,
+                                           detail_concurrency, detail_timeout, priority, delay_policy=delay_policy):
+        all_jobs.extend(jobs)
+    
+    print(f"Total jobs collected: {len(all_jobs)}")
+    return all_jobs
+
 
 class NaukriSeleniumScraper:
-    def __init__(self, headless=True, disable_images=True):
-        chrome_options = Options()
-        if headless:
-            chrome_options.add_argument("--headless")
-        chrome_options.add_argument("--window-size=1920,1080")
-        chrome_options.add_argument("--disable-notifications")
-        chrome_options.add_argument("--disable-popup-blocking")
-        chrome_options.add_argument("--disable-infobars")
-        chrome_options.add_argument("--disable-extensions")
-        chrome_options.add_argument("--disable-gpu")
-        chrome_options.add_argument("--no-sandbox")
-        chrome_options.add_argument("--disable-dev-shm-usage")
-        
-        chrome_options.add_argument("--user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/123.0.0.0 Safari/537.36")
-        
-        if disable_images:
-            chrome_prefs = {"profile.managed_default_content_settings.images": 2}
-            chrome_options.add_experimental_option("prefs", chrome_prefs)
-        
-        self.driver = webdriver.Chrome(service=Service(ChromeDriverManager().install()), options=chrome_options)
+    def __init__(self, headless=True, disable_images=True, driver=None, delay_policy=None, batch_extract=True,
+                 priority=INTERACTIVE, rate_limiter=None):
+        # A driver passed in (e.g. from a DriverPool) is borrowed, not owned: close() leaves it running.
+        self.owns_driver = driver is None
+        self.driver = driver if driver is not None else create_driver(headless, disable_images)
         self.wait = WebDriverWait(self.driver, 10)
         self.base_url = "https://www.naukri.com"
+        # Politeness gaps between page loads; everything else waits on the DOM.
+        self.delay_policy = delay_policy if delay_policy is not None else default_delay_policy()
+        self.batch_extract = batch_extract
+        # Shared with every other scraper (both backends), so concurrent scrapes don't burst
+        self.priority = priority
+        self.rate_limiter = rate_limiter or NAUKRI_RATE_LIMITER
+    
+    def throttle(self, timeout=15):
+        """Take a token from the shared Naukri limiter before loading a page."""
+        if not self.rate_limiter.acquire(self.priority, timeout=timeout):
+            raise RateLimitTimeout("Rate limit wait exceeded")
     
     def close(self):
-        if self.driver:
+        if self.driver and self.owns_driver:
             self.driver.quit()
     
     def navigate_to_search_page(self):
+        self.throttle()
         self.driver.get(self.base_url)
-        time.sleep(3) 
+        self.wait.until(
+            EC.presence_of_element_located((By.CLASS_NAME, "suggestor-input"))
+        )
         
-        try:
-            popup_close = WebDriverWait(self.driver, 5).until(
-                EC.element_to_be_clickable((By.CLASS_NAME, "crossIcon"))
-            )
-            popup_close.click()
-            time.sleep(1)
-        except TimeoutException:
-            pass 
+        # The promo popup is either already rendered with the page or not shown at all,
+        # so look for it once instead of waiting for it to maybe appear.
+        for popup_close in self.driver.find_elements(By.CLASS_NAME, "crossIcon"):
+            try:
+                if popup_close.is_displayed():
+                    popup_close.click()
+                    WebDriverWait(self.driver, 3).until(EC.invisibility_of_element(popup_close))
+                    break
+            except (TimeoutException, StaleElementReferenceException):
+                pass
+    
+    def wait_for_job_cards(self):
+        return self.wait.until(
+            EC.presence_of_all_elements_located((By.CLASS_NAME, JOB_CARD_CLASS))
+        )
     
     def search_jobs(self, keyword, location=None, experience=None):
         self.navigate_to_search_page()
@@ -88,18 +297,18 @@ class NaukriSeleniumScraper:
             if experience:
                 self.apply_experience_filter(experience)
             
-            time.sleep(3) 
+            self.wait_for_job_cards()
         
         except Exception as e:
             print(f"Error during search: {e}")
     
     def apply_experience_filter(self, experience):
+        experience = str(experience)
         try:
             exp_filter = self.wait.until(
                 EC.element_to_be_clickable((By.XPATH, "//div[contains(text(), 'Experience')]"))
             )
             exp_filter.click()
-            time.sleep(1)
             
             if '-' in experience:
                 min_exp, max_exp = experience.split('-')
@@ -118,8 +327,13 @@ class NaukriSeleniumScraper:
                         EC.element_to_be_clickable((By.XPATH, f"//span[contains(text(), '{experience} Yrs')]"))
                     )
             
+            cards = self.driver.find_elements(By.CLASS_NAME, JOB_CARD_CLASS)
             exp_option.click()
-            time.sleep(2)
+            
+            # Filtering re-renders the result list; wait for the old cards to go away.
+            if cards:
+                self.wait.until(EC.staleness_of(cards[0]))
+            self.wait_for_job_cards()
             
         except TimeoutException:
             print(f"Could not find experience filter for '{experience}'")
@@ -128,14 +342,22 @@ class NaukriSeleniumScraper:
             except:
                 pass
     
-    def extract_jobs_from_page(self):
-        jobs = []
+    def extract_jobs_from_page(self, batch=None):
+        return list(self.iter_jobs_from_page(batch))
+    
+    def iter_jobs_from_page(self, batch=None):
+        batch = self.batch_extract if batch is None else batch
         
         try:
-            job_cards = self.wait.until(
-                EC.presence_of_all_elements_located((By.CLASS_NAME, "styles_job-listing-container__OCfZC"))
-            )
-
+            job_cards = self.wait_for_job_cards()
+            
+            if batch:
+                try:
+                    jobs = self.driver.execute_script(EXTRACT_CARDS_JS, JOB_CARD_CLASS, CARD_FIELDS) or []
+                    yield from jobs
+                    return
+                except JavascriptException as e:
+                    print(f"Batch extraction failed, falling back to per-element reads: {e}")
             
             for card in job_cards:
                 job = {}
@@ -190,13 +412,10 @@ class NaukriSeleniumScraper:
                 except NoSuchElementException:
                     job['skills'] = "Not specified"
                 
-                jobs.append(job)
-            
-            return jobs
+                yield job
         
         except TimeoutException:
             print("Timeout waiting for job cards to load.")
-            return []
     
     def navigate_to_next_page(self):
         try:
@@ -208,14 +427,15 @@ class NaukriSeleniumScraper:
                 return False
             
             self.driver.execute_script("arguments[0].scrollIntoView(true);", next_button)
-            time.sleep(1)
+            self.wait.until(EC.element_to_be_clickable(next_button))
             
+            self.throttle()
             next_button.click()
             
             self.wait.until(
                 EC.staleness_of(next_button)
             )
-            time.sleep(3) 
+            self.wait_for_job_cards()
             
             return True
         
@@ -223,12 +443,56 @@ class NaukriSeleniumScraper:
             print(f"Error navigating to next page: {e}")
             return False
     
-    def get_job_details(self, job_url):
+    def read_job_detail_fields(self):
         details = {}
         
         try:
+            jd_elem = self.driver.find_element(By.CLASS_NAME, "job-desc")
+            details['full_description'] = jd_elem.text.strip()
+        except NoSuchElementException:
+            details['full_description'] = "Not provided"
+        
+        try:
+            role_elem = self.driver.find_element(By.CLASS_NAME, "role-section")
+            details['role'] = role_elem.text.strip()
+        except NoSuchElementException:
+            details['role'] = "Not specified"
+        
+        try:
+            company_info = self.driver.find_element(By.CLASS_NAME, "about-company")
+            details['company_details'] = company_info.text.strip()
+        except NoSuchElementException:
+            details['company_details'] = "Not provided"
+        
+        try:
+            skills_section = self.driver.find_element(By.CLASS_NAME, "key-skill")
+            skills = skills_section.find_elements(By.CLASS_NAME, "chip")
+            details['required_skills'] = ", ".join([skill.text.strip() for skill in skills])
+        except NoSuchElementException:
+            details['required_skills'] = "Not specified"
+        
+        return details
+    
+    def load_job_details(self, job_url, timeout=15, throttle=True):
+        # Detail page in the current tab; for drivers dedicated to detail fetching.
+        # throttle=False when the caller already holds a token for this load.
+        if throttle:
+            self.throttle(timeout)
+        self.driver.set_page_load_timeout(timeout)
+        try:
+            self.driver.get(job_url)
+            WebDriverWait(self.driver, timeout).until(
+                EC.presence_of_element_located((By.CLASS_NAME, "jd-container"))
+            )
+            return self.read_job_detail_fields()
+        finally:
+            self.driver.set_page_load_timeout(300)
+    
+    def get_job_details(self, job_url):
+        try:
+            self.throttle()
             self.driver.execute_script(f"window.open('{job_url}', '_blank');")
-            time.sleep(2)
+            self.wait.until(EC.number_of_windows_to_be(2))
             
             self.driver.switch_to.window(self.driver.window_handles[1])
             
@@ -236,30 +500,7 @@ class NaukriSeleniumScraper:
                 EC.presence_of_element_located((By.CLASS_NAME, "jd-container"))
             )
             
-            try:
-                jd_elem = self.driver.find_element(By.CLASS_NAME, "job-desc")
-                details['full_description'] = jd_elem.text.strip()
-            except NoSuchElementException:
-                details['full_description'] = "Not provided"
-            
-            try:
-                role_elem = self.driver.find_element(By.CLASS_NAME, "role-section")
-                details['role'] = role_elem.text.strip()
-            except NoSuchElementException:
-                details['role'] = "Not specified"
-            
-            try:
-                company_info = self.driver.find_element(By.CLASS_NAME, "about-company")
-                details['company_details'] = company_info.text.strip()
-            except NoSuchElementException:
-                details['company_details'] = "Not provided"
-            
-            try:
-                skills_section = self.driver.find_element(By.CLASS_NAME, "key-skill")
-                skills = skills_section.find_elements(By.CLASS_NAME, "chip")
-                details['required_skills'] = ", ".join([skill.text.strip() for skill in skills])
-            except NoSuchElementException:
-                details['required_skills'] = "Not specified"
+            details = self.read_job_detail_fields()
             
             self.driver.close()
             self.driver.switch_to.window(self.driver.window_handles[0])
@@ -279,10 +520,68 @@ class NaukriSeleniumScraper:
             return {}
     
 
-    def run_scraper(self, keyword, location=None, experience=None, pages=3, fetch_details=False):
-        all_jobs = []
+    def scrape_page(self, keyword, location=None, experience=None, page=1, throttle=True):
+        if throttle:
+            self.throttle()
+        started = time.monotonic()
+        self.driver.get(build_search_url(keyword, location, experience, page, self.base_url))
+        jobs = self.extract_jobs_from_page()
+        self.delay_policy.observe(time.monotonic() - started)
+        print(f"Found {len(jobs)} jobs on page {page}")
+        return jobs
+    
+    def iter_pages_in_tabs(self, keyword, location=None, experience=None, pages=3):
+        # Open every page at once so the browser loads them side by side, then read them in order.
+        main_window = self.driver.current_window_handle
+        # Tokens for every tab up front, so a rate limit timeout can't leave tabs half opened
+        for _ in range(2, pages + 1):
+            self.throttle()
+        for page in range(2, pages + 1):
+            url = build_search_url(keyword, location, experience, page, self.base_url)
+            self.driver.execute_script("window.open(arguments[0], '_blank');", url)
+        tabs = [h for h in self.driver.window_handles if h != main_window]
         
         try:
+            yield 1, self.scrape_page(keyword, location, experience, 1)
+            while tabs:
+                page = pages - len(tabs) + 1
+                self.driver.switch_to.window(tabs[0])
+                try:
+                    jobs = self.extract_jobs_from_page()
+                    print(f"Found {len(jobs)} jobs on page {page}")
+                finally:
+                    self.driver.close()
+                    tabs.pop(0)
+                    self.driver.switch_to.window(main_window)
+                yield page, jobs
+        finally:
+            # Also runs when the consumer stops early; don't leave tabs behind on a pooled driver
+            for handle in tabs:
+                self.driver.switch_to.window(handle)
+                self.driver.close()
+            self.driver.switch_to.window(main_window)
+    
+    def add_job_details(self, jobs):
+        for i, job in enumerate(jobs):
+            if 'url' in job:
+                print(f"Fetching details for job {i+1}/{len(jobs)}...")
+                started = time.monotonic()
+                details = self.get_job_details(job['url'])
+                self.delay_policy.observe(time.monotonic() - started)
+                job.update(details)
+                
+                self.delay_policy.pause()
+    
+    def iter_scraper(self, keyword, location=None, experience=None, pages=3, fetch_details=False, by_url=False):
+        """Yield (page_number, jobs) as each result page is scraped."""
+        try:
+            if by_url:
+                for page, jobs in self.iter_pages_in_tabs(keyword, location, experience, pages):
+                    if fetch_details and jobs:
+                        self.add_job_details(jobs)
+                    yield page, jobs
+                return
+            
             self.search_jobs(keyword, location, experience)
             
             page_count = 1
@@ -292,38 +591,32 @@ class NaukriSeleniumScraper:
                 
                 jobs = self.extract_jobs_from_page()
                 print(f"Found {len(jobs)} jobs on page {page_count}")
-                print(jobs)
                 
                 if fetch_details and jobs:
-                    for i, job in enumerate(jobs):
-                        if 'url' in job:
-                            print(f"Fetching details for job {i+1}/{len(jobs)}...")
-                            details = self.get_job_details(job['url'])
-                            job.update(details)
-                            
-                            time.sleep(random.uniform(1.0, 2.0))
+                    self.add_job_details(jobs)
                 
-                all_jobs.extend(jobs)
+                yield page_count, jobs
                 
                 if page_count < pages:
+                    self.delay_policy.pause()
+                    started = time.monotonic()
                     has_next = self.navigate_to_next_page()
+                    self.delay_policy.observe(time.monotonic() - started)
                     if not has_next:
                         print("No more pages available.")
                         break
-                    time.sleep(random.uniform(2.0, 3.0)) 
                 
                 page_count += 1
             
-            print(f"Total jobs collected: {len(all_jobs)}")
-            return all_jobs
-            
         except Exception as e:
             print(f"Error during scraping: {e}")
-            return all_jobs
-        
-        finally:
-            pass
-
+    
+    def run_scraper(self, keyword, location=None, experience=None, pages=3, fetch_details=False, by_url=False):
+        all_jobs = []
+        for _, jobs in self.iter_scraper(keyword, location, experience, pages, fetch_details, by_url):
+            all_jobs.extend(jobs)
+        print(f"Total jobs collected: {len(all_jobs)}")
+        return all_jobs
 
 if __name__ == "__main__":
     try:
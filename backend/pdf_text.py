@@ -0,0 +1,253 @@
+"""Resume PDF text extraction with pluggable parser backends.
+
+    result = extract_pdf_text(path_or_bytes)
+    result.text, result.page_count, result.timings   # timings: [(page, seconds), ...]
+
+    for page in iter_pdf_pages(data):                # stream pages as they are parsed
+        ...
+
+Backends are tried in PDF_BACKENDS order among those installed; PyPDF2 is the
+only one the app requires. Documents with at least PDF_PARALLEL_MIN_PAGES pages
+are split into page ranges parsed by PDF_PAGE_WORKERS processes (0 = always
+serial). Limits on bytes, pages and wall time raise PdfExtractionError, which
+carries a machine-readable `code`.
+
+The wall-time limit is best-effort: it is checked between pages (and, in the
+parallel path, between page ranges), so one pathological page can run past it,
+and a range already running in a worker is not stopped. Callers that need a hard
+bound stop waiting after PDF_TIMEOUT themselves (see main.wait_extraction).
+"""
+
+import importlib.util
+import io
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, TimeoutError as FutureTimeout
+
+PDF_MAX_BYTES = int(os.environ.get("PDF_MAX_BYTES", str(10 * 1024 * 1024)))
+PDF_MAX_PAGES = int(os.environ.get("PDF_MAX_PAGES", "50"))
+PDF_TIMEOUT = float(os.environ.get("PDF_TIMEOUT", "20"))
+PDF_BACKENDS = [b.strip() for b in os.environ.get("PDF_BACKENDS", "pymupdf,pypdf,pypdf2").split(",") if b.strip()]
+PDF_PAGE_WORKERS = int(os.environ.get("PDF_PAGE_WORKERS", "0"))
+PDF_PARALLEL_MIN_PAGES = int(os.environ.get("PDF_PARALLEL_MIN_PAGES", "8"))
+
+# Error codes
+TOO_LARGE = "too_large"
+TOO_MANY_PAGES = "too_many_pages"
+TIMEOUT = "timeout"
+UNREADABLE = "unreadable"
+NO_BACKEND = "no_backend"
+
+
+class PdfExtractionError(Exception):
+    def __init__(self, code, message, page=None):
+        # Passing every field to Exception keeps the error picklable across process pools
+        super().__init__(code, message, page)
+        self.code = code
+        self.message = message
+        self.page = page
+
+    def __str__(self):
+        where = f" (page {self.page})" if self.page is not None else ""
+        return f"{self.message}{where}"
+
+    def to_dict(self):
+        return {"code": self.code, "message": self.message, "page": self.page}
+
+
+# ========== BACKENDS ==========
+# Each backend opens a document from bytes and returns (page_count, page_text(index)).
+
+def _open_pymupdf(data):
+    import fitz
+    doc = fitz.open(stream=data, filetype="pdf")
+    return doc.page_count, lambda i: doc.load_page(i).get_text()
+
+
+def _open_pypdf(data):
+    import pypdf
+    reader = pypdf.PdfReader(io.BytesIO(data))
+    return len(reader.pages), lambda i: reader.pages[i].extract_text()
+
+
+def _open_pypdf2(data):
+    import PyPDF2
+    reader = PyPDF2.PdfReader(io.BytesIO(data))
+    return len(reader.pages), lambda i: reader.pages[i].extract_text()
+
+
+BACKENDS = {
+    "pymupdf": ("fitz", _open_pymupdf),
+    "pypdf": ("pypdf", _open_pypdf),
+    "pypdf2": ("PyPDF2", _open_pypdf2),
+}
+
+
+def available_backends():
+    return [name for name in PDF_BACKENDS if name in BACKENDS and importlib.util.find_spec(BACKENDS[name][0])]
+
+
+def choose_backend(backend=None):
+    if backend is not None:
+        if backend not in BACKENDS or not importlib.util.find_spec(BACKENDS[backend][0]):
+            raise PdfExtractionError(NO_BACKEND, f"PDF backend '{backend}' is not installed")
+        return backend
+    backends = available_backends()
+    if not backends:
+        raise PdfExtractionError(NO_BACKEND, f"None of the PDF backends {PDF_BACKENDS} is installed")
+    return backends[0]
+
+
+def _open(data, backend):
+    try:
+        return BACKENDS[backend][1](data)
+    except Exception as e:
+        raise PdfExtractionError(UNREADABLE, f"Could not open PDF with {backend}: {e}") from e
+
+
+def _page_text(page_text, index, backend):
+    try:
+        return page_text(index) or ""
+    except Exception as e:
+        raise PdfExtractionError(UNREADABLE, f"{backend} failed to extract text: {e}", page=index + 1) from e
+
+
+def _extract_range(data, backend, start, end):
+    """Worker half of parallel extraction: [(page, text, seconds)] for pages start..end-1."""
+    _, page_text = _open(data, backend)
+    pages = []
+    for index in range(start, end):
+        started = time.perf_counter()
+        text = _page_text(page_text, index, backend)
+        pages.append((index + 1, text, time.perf_counter() - started))
+    return pages
+
+
+# ========== EXTRACTION ==========
+
+class PdfPage:
+    __slots__ = ("number", "text", "seconds")
+
+    def __init__(self, number, text, seconds):
+        self.number = number
+        self.text = text
+        self.seconds = seconds
+
+
+class PdfText:
+    def __init__(self, pages, page_count, backend, seconds):
+        self.pages = pages
+        self.page_count = page_count
+        self.backend = backend
+        self.seconds = seconds
+
+    @property
+    def text(self):
+        return " ".join(page.text for page in self.pages)
+
+    @property
+    def timings(self):
+        return [(page.number, page.seconds) for page in self.pages]
+
+    def stats(self):
+        return {
+            "backend": self.backend,
+            "pages": self.page_count,
+            "seconds": round(self.seconds, 4),
+            "page_seconds": [round(page.seconds, 4) for page in self.pages],
+        }
+
+
+def read_pdf_bytes(source, max_bytes=None):
+    """Bytes of a PDF given as a path, bytes or a binary file object, within max_bytes."""
+    max_bytes = PDF_MAX_BYTES if max_bytes is None else max_bytes
+    if isinstance(source, (bytes, bytearray, memoryview)):
+        data = bytes(source)
+    elif isinstance(source, (str, os.PathLike)):
+        try:
+            if max_bytes and os.path.getsize(source) > max_bytes:
+                raise PdfExtractionError(TOO_LARGE, f"PDF is larger than {max_bytes} bytes")
+            with open(source, "rb") as f:
+                data = f.read()
+        except OSError as e:
+            raise PdfExtractionError(UNREADABLE, f"Could not read PDF: {e}") from e
+    else:
+        # Read one byte past the limit so oversized streams are caught without reading them whole
+        data = source.read(max_bytes + 1) if max_bytes else source.read()
+    if max_bytes and len(data) > max_bytes:
+        raise PdfExtractionError(TOO_LARGE, f"PDF is larger than {max_bytes} bytes")
+    return data
+
+
+_page_pools = {}
+
+
+def _get_page_pool(workers):
+    # Started on first parallel extraction, then kept so later documents skip process start-up
+    pool = _page_pools.get(workers)
+    if pool is None:
+        pool = _page_pools[workers] = ProcessPoolExecutor(max_workers=workers)
+    return pool
+
+
+def iter_pdf_pages(source, backend=None, max_pages=None, max_bytes=None, timeout=None, workers=None):
+    """Yield PdfPage objects in page order as they are extracted.
+
+    Pages beyond the page limit raise PdfExtractionError(TOO_MANY_PAGES) before any
+    parsing; running past `timeout` seconds raises PdfExtractionError(TIMEOUT).
+    """
+    max_pages = PDF_MAX_PAGES if max_pages is None else max_pages
+    timeout = PDF_TIMEOUT if timeout is None else timeout
+    workers = PDF_PAGE_WORKERS if workers is None else workers
+    deadline = time.monotonic() + timeout if timeout else None
+
+    data = read_pdf_bytes(source, max_bytes)
+    backend = choose_backend(backend)
+    page_count, page_text = _open(data, backend)
+    if max_pages and page_count > max_pages:
+        raise PdfExtractionError(TOO_MANY_PAGES, f"PDF has {page_count} pages, the limit is {max_pages}")
+
+    if workers > 1 and page_count >= PDF_PARALLEL_MIN_PAGES:
+        yield from _iter_pages_parallel(data, backend, page_count, workers, deadline)
+        return
+
+    for index in range(page_count):
+        if deadline is not None and time.monotonic() > deadline:
+            raise PdfExtractionError(TIMEOUT, f"PDF extraction took longer than {timeout}s", page=index + 1)
+        started = time.perf_counter()
+        text = _page_text(page_text, index, backend)
+        yield PdfPage(index + 1, text, time.perf_counter() - started)
+
+
+def _iter_pages_parallel(data, backend, page_count, workers, deadline):
+    pool = _get_page_pool(workers)
+    chunk = -(-page_count // workers)
+    futures = [pool.submit(_extract_range, data, backend, start, min(start + chunk, page_count))
+               for start in range(0, page_count, chunk)]
+    try:
+        # Ranges complete out of order; yield them in page order
+        for future in futures:
+            remaining = None if deadline is None else max(0.0, deadline - time.monotonic())
+            try:
+                pages = future.result(timeout=remaining)
+            except FutureTimeout:
+                raise PdfExtractionError(TIMEOUT, "PDF extraction timed out") from None
+            for number, text, seconds in pages:
+                yield PdfPage(number, text, seconds)
+    finally:
+        for future in futures:
+            future.cancel()
+
+
+def extract_pdf_text(source, backend=None, max_pages=None, max_bytes=None, timeout=None, workers=None):
+    """All pages of a PDF as a PdfText (text, per-page timings, backend used)."""
+    started = time.perf_counter()
+    backend = choose_backend(backend)
+    pages = list(iter_pdf_pages(source, backend, max_pages, max_bytes, timeout, workers))
+    return PdfText(pages, len(pages), backend, time.perf_counter() - started)
+
+
+def close():
+    while _page_pools:
+        _, pool = _page_pools.popitem()
+        pool.shutdown(wait=False, cancel_futures=True)
@@ -0,0 +1,185 @@
+#!/usr/bin/env python3
+"""Background precrawl of every (title x location x experience) search /upload can ask for.
+
+job_data.json defines every title a resume can be matched to, so the searches
+/upload runs are known in advance. The scheduler refreshes them in rounds,
+keeping the scrape cache warm so uploads answer from precomputed listings:
+
+    python precrawl.py --dry-run --rounds 2       # against a local stand-in server
+    PRECRAWL_ENABLED=1 python -m uvicorn main:app  # in the app, see main.lifespan
+
+Each round crawls at most `budget` searches (and stops after `round_seconds`).
+A search is due once its last crawl is older than `max_age`. Due searches go in
+order of demand (titles /upload recommended most often first), then staleness
+(never crawled, then least recently crawled).
+"""
+
+import argparse
+import json
+import os
+import threading
+import time
+from collections import Counter
+
+PRECRAWL_ENABLED = os.environ.get("PRECRAWL_ENABLED", "0") == "1"
+PRECRAWL_LOCATIONS = [l.strip() for l in os.environ.get("PRECRAWL_LOCATIONS", "Bangalore").split(",") if l.strip()]
+PRECRAWL_EXPERIENCES = [e.strip() for e in os.environ.get("PRECRAWL_EXPERIENCES", "2").split(",") if e.strip()]
+PRECRAWL_BUDGET = int(os.environ.get("PRECRAWL_BUDGET", "20"))
+PRECRAWL_INTERVAL = float(os.environ.get("PRECRAWL_INTERVAL", "600"))
+# Below SCRAPE_CACHE_TTL, so a precrawled entry is refreshed before it expires
+PRECRAWL_MAX_AGE = float(os.environ.get("PRECRAWL_MAX_AGE", "3000"))
+PRECRAWL_ROUND_SECONDS = float(os.environ.get("PRECRAWL_ROUND_SECONDS", "0"))
+
+
+def refresh_listing(keyword, location, experience, pages, fetch_details):
+    # Imported on first crawl: both read their config from the environment at import time
+    import scraping
+    from rate_limit import BACKGROUND
+    return scraping.run_scraper(
+        keyword, location, experience, pages, fetch_details, incremental=True, refresh=True, priority=BACKGROUND
+    )
+
+
+class PrecrawlScheduler:
+    def __init__(self, titles, locations=None, experiences=None, pages=3, fetch_details=False, budget=None,
+                 interval=None, max_age=None, round_seconds=None, crawl=refresh_listing):
+        locations = locations or PRECRAWL_LOCATIONS
+        experiences = experiences or PRECRAWL_EXPERIENCES
+        self.searches = [(title, location, experience) for title in titles for location in locations for experience in experiences]
+        self.pages = pages
+        self.fetch_details = fetch_details
+        self.budget = PRECRAWL_BUDGET if budget is None else budget
+        self.interval = PRECRAWL_INTERVAL if interval is None else interval
+        self.max_age = PRECRAWL_MAX_AGE if max_age is None else max_age
+        self.round_seconds = PRECRAWL_ROUND_SECONDS if round_seconds is None else round_seconds
+        self.crawl = crawl
+        self.demand = Counter()
+        self.last_crawled = {}
+        self.counters = {
+            "rounds": 0, "crawls": 0, "failures": 0, "empty": 0, "jobs": 0,
+            "deferred": 0, "crawl_seconds": 0.0, "last_round_seconds": 0.0,
+        }
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread = None
+
+    def record_demand(self, title):
+        """Count a search /upload actually ran, so popular titles are refreshed first."""
+        with self._lock:
+            self.demand[title.strip().lower()] += 1
+
+    def due(self, now=None):
+        """Searches whose listing is older than max_age, highest priority first."""
+        now = time.time() if now is None else now
+        with self._lock:
+            due = [search for search in self.searches if now - self.last_crawled.get(search, float("-inf")) >= self.max_age]
+            due.sort(key=lambda search: (-self.demand[search[0].strip().lower()], self.last_crawled.get(search, float("-inf"))))
+        return due
+
+    def run_round(self):
+        """Crawl due searches within the budget; returns how many were crawled."""
+        started = time.perf_counter()
+        due = self.due()
+        crawled = 0
+        for title, location, experience in due[:self.budget]:
+            if self._stop.is_set() or (self.round_seconds and time.perf_counter() - started > self.round_seconds):
+                break
+            crawl_started = time.perf_counter()
+            try:
+                jobs = self.crawl(title, location, experience, self.pages, self.fetch_details)
+            except Exception as e:
+                print(f"Precrawl of '{title}' in {location} failed: {e}")
+                self._count("failures")
+                jobs = None
+            with self._lock:
+                self.counters["crawl_seconds"] += time.perf_counter() - crawl_started
+                if jobs is not None:
+                    # An empty result is retried next round instead of waiting max_age
+                    if jobs:
+                        self.last_crawled[(title, location, experience)] = time.time()
+                    self.counters["crawls"] += 1
+                    self.counters["jobs"] += len(jobs)
+                    self.counters["empty"] += not jobs
+            crawled += 1
+        with self._lock:
+            self.counters["rounds"] += 1
+            self.counters["deferred"] += len(due) - crawled
+            self.counters["last_round_seconds"] = time.perf_counter() - started
+        return crawled
+
+    def _count(self, name):
+        with self._lock:
+            self.counters[name] += 1
+
+    def _loop(self):
+        while not self._stop.is_set():
+            try:
+                self.run_round()
+            except Exception as e:
+                print(f"Precrawl round failed: {e}")
+            self._stop.wait(self.interval)
+
+    def start(self):
+        if self._thread is None:
+            self._stop.clear()
+            self._thread = threading.Thread(target=self._loop, name="precrawl", daemon=True)
+            self._thread.start()
+
+    def stop(self, timeout=None):
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+
+    def stats(self):
+        now = time.time()
+        with self._lock:
+            fresh = sum(1 for search in self.searches if now - self.last_crawled.get(search, float("-inf")) < self.max_age)
+            stats = dict(self.counters, searches=len(self.searches), fresh=fresh, running=self._thread is not None)
+        stats["coverage"] = fresh / len(self.searches) if self.searches else 0.0
+        return stats
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Precrawl every job_data.json title")
+    parser.add_argument("--dry-run", action="store_true", help="crawl a local stand-in server instead of naukri.com")
+    parser.add_argument("--rounds", type=int, default=1)
+    parser.add_argument("--budget", type=int, default=PRECRAWL_BUDGET)
+    parser.add_argument("--titles", type=int, default=0, help="only the first N titles (0 = all)")
+    parser.add_argument("--latency", type=float, default=0.0, help="stand-in server response delay (s)")
+    parser.add_argument("--rate", type=float, default=None, help="NAUKRI_RATE for this run (0 = unlimited)")
+    args = parser.parse_args()
+
+    if args.dry_run:
+        from standin_server import start_standin_server
+        server, base_url = start_standin_server(latency=args.latency)
+        # Must be set before scraping is imported; it reads its config at import time
+        os.environ["NAUKRI_BASE_URL"] = base_url
+        os.environ["SCRAPER_BACKEND"] = "http-only"
+        os.environ["SCRAPE_CACHE_DB"] = ""
+        os.environ["JOB_STORE_DB"] = ""
+        # The stand-in server needs no politeness; --rate below still overrides this
+        os.environ["NAUKRI_RATE"] = "0"
+    if args.rate is not None:
+        # Read by rate_limit at import time, like the scraping settings above
+        os.environ["NAUKRI_RATE"] = str(args.rate)
+
+    with open(os.path.join(os.path.dirname(os.path.abspath(__file__)), "job_data.json")) as f:
+        titles = list(json.load(f))
+    if args.titles:
+        titles = titles[:args.titles]
+
+    scheduler = PrecrawlScheduler(titles, budget=args.budget)
+    for round_number in range(1, args.rounds + 1):
+        crawled = scheduler.run_round()
+        stats = scheduler.stats()
+        print(f"round {round_number}: crawled {crawled}, {stats['jobs']} jobs so far, "
+              f"coverage {stats['coverage']:.0%} of {stats['searches']} searches, {stats['last_round_seconds']:.2f}s")
+    print(json.dumps(scheduler.stats(), indent=2))
+
+    import scraping
+    scraping.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,221 @@
+import heapq
+import itertools
+import os
+import sqlite3
+import threading
+import time
+
+
+class TokenBucket:
+    """Classic token bucket: `rate` tokens per second, holding at most `burst`."""
+
+    def __init__(self, rate, burst=1):
+        self.rate = rate
+        self.burst = burst
+        self.tokens = burst
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+
+    def _refill(self, now):
+        self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def try_acquire(self, tokens=1):
+        """Take tokens if available; otherwise return how long to wait for them."""
+        with self.lock:
+            self._refill(time.monotonic())
+            if self.tokens >= tokens:
+                self.tokens -= tokens
+                return 0.0
+            return (tokens - self.tokens) / self.rate
+
+    def acquire(self, tokens=1, timeout=None):
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            wait = self.try_acquire(tokens)
+            if wait == 0.0:
+                return True
+            if deadline is not None and time.monotonic() + wait > deadline:
+                return False
+            time.sleep(wait)
+
+
+class HostRateLimiter:
+    """One token bucket per host, created on first use."""
+
+    def __init__(self, rate=2.0, burst=2):
+        self.rate = rate
+        self.burst = burst
+        self.buckets = {}
+        self.lock = threading.Lock()
+
+    def bucket(self, host):
+        with self.lock:
+            if host not in self.buckets:
+                self.buckets[host] = TokenBucket(self.rate, self.burst)
+            return self.buckets[host]
+
+    def acquire(self, host, timeout=None):
+        return self.bucket(host).acquire(timeout=timeout)
+
+
+# Shared across calls (and scraper backends) so concurrent scrapes together respect the per-host limit.
+DETAIL_RATE_LIMITER = HostRateLimiter(rate=2.0, burst=4)
+
+
+# ========== GLOBAL PRIORITY LIMITER ==========
+
+# Priority classes, most urgent first: /upload scrapes jump ahead of precrawl.py
+INTERACTIVE = "interactive"
+BACKGROUND = "background"
+PRIORITIES = (INTERACTIVE, BACKGROUND)
+
+# Requests per second to Naukri across every scraper in the process (0 = unlimited).
+# With NAUKRI_RATE_DB set, the bucket lives in that SQLite file and is shared by every
+# process using it (e.g. several uvicorn workers plus a precrawl.py run).
+NAUKRI_RATE = float(os.environ.get("NAUKRI_RATE", "4"))
+NAUKRI_BURST = int(os.environ.get("NAUKRI_BURST", "8"))
+NAUKRI_RATE_DB = os.environ.get("NAUKRI_RATE_DB", "")
+
+
+class RateLimitTimeout(Exception):
+    """No token from the shared Naukri limiter in time.
+
+    Naukri itself didn't fail, so this must not trigger a fallback to another
+    backend (it waits on the same limiter) or mark a pooled driver as broken.
+    """
+
+
+class SqliteTokenBucket:
+    """TokenBucket whose state is a row in a SQLite file, so several processes share one budget.
+
+    Refill and take happen in one write transaction; time is wall-clock because
+    monotonic clocks aren't comparable across processes.
+    """
+
+    def __init__(self, db_path, name, rate, burst=1):
+        self.name = name
+        self.rate = rate
+        self.burst = burst
+        self.lock = threading.Lock()
+        self._db = sqlite3.connect(db_path, timeout=10, check_same_thread=False, isolation_level=None)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("CREATE TABLE IF NOT EXISTS buckets (name TEXT PRIMARY KEY, tokens REAL, updated REAL)")
+        self._db.execute("INSERT OR IGNORE INTO buckets VALUES (?, ?, ?)", (name, burst, time.time()))
+
+    def try_acquire(self, tokens=1):
+        """Take tokens if available; otherwise return how long to wait for them."""
+        with self.lock:
+            self._db.execute("BEGIN IMMEDIATE")
+            try:
+                stored, updated = self._db.execute(
+                    "SELECT tokens, updated FROM buckets WHERE name = ?", (self.name,)
+                ).fetchone()
+                now = time.time()
+                available = min(self.burst, stored + max(0.0, now - updated) * self.rate)
+                wait = 0.0
+                if available >= tokens:
+                    available -= tokens
+                else:
+                    wait = (tokens - available) / self.rate
+                self._db.execute("UPDATE buckets SET tokens = ?, updated = ? WHERE name = ?", (available, now, self.name))
+                self._db.execute("COMMIT")
+            except Exception:
+                self._db.execute("ROLLBACK")
+                raise
+            return wait
+
+    def close(self):
+        with self.lock:
+            self._db.close()
+
+
+class PriorityRateLimiter:
+    """Hands out a shared bucket's tokens to waiting threads in priority order.
+
+    Waiters queue by (priority class, arrival); only the head of the queue takes
+    tokens, so a queued interactive request is served before any background one
+    that arrived earlier. With a SqliteTokenBucket the rate is shared across
+    processes, but the priority order only holds within each process.
+    `bucket=None` never waits.
+    """
+
+    def __init__(self, bucket):
+        self.bucket = bucket
+        self._cond = threading.Condition()
+        self._queue = []
+        self._arrivals = itertools.count()
+        self._metrics = {
+            priority: {"requests": 0, "granted": 0, "throttled": 0, "timeouts": 0,
+                       "wait_seconds": 0.0, "max_wait_seconds": 0.0, "queued": 0, "max_queued": 0}
+            for priority in PRIORITIES
+        }
+
+    def acquire(self, priority=INTERACTIVE, timeout=None):
+        """Block until a token is granted (True) or `timeout` seconds pass (False)."""
+        rank = PRIORITIES.index(priority)
+        metrics = self._metrics[priority]
+        started = time.monotonic()
+        deadline = None if timeout is None else started + timeout
+        ticket = (rank, next(self._arrivals))
+        with self._cond:
+            metrics["requests"] += 1
+            if self.bucket is None:
+                metrics["granted"] += 1
+                return True
+            heapq.heappush(self._queue, ticket)
+            metrics["queued"] += 1
+            metrics["max_queued"] = max(metrics["max_queued"], metrics["queued"])
+            try:
+                while True:
+                    wait = None
+                    if self._queue[0] == ticket:
+                        wait = self.bucket.try_acquire()
+                        if wait == 0.0:
+                            break
+                    now = time.monotonic()
+                    if deadline is not None and now >= deadline:
+                        metrics["timeouts"] += 1
+                        return False
+                    if deadline is not None:
+                        wait = deadline - now if wait is None else min(wait, deadline - now)
+                    # Non-head waiters sleep until the head changes
+                    self._cond.wait(wait)
+            finally:
+                self._queue.remove(ticket)
+                heapq.heapify(self._queue)
+                metrics["queued"] -= 1
+                self._cond.notify_all()
+
+            waited = time.monotonic() - started
+            metrics["granted"] += 1
+            metrics["wait_seconds"] += waited
+            metrics["max_wait_seconds"] = max(metrics["max_wait_seconds"], waited)
+            if waited > 0.001:
+                metrics["throttled"] += 1
+            return True
+
+    def stats(self):
+        with self._cond:
+            classes = {priority: dict(metrics) for priority, metrics in self._metrics.items()}
+        for metrics in classes.values():
+            metrics["avg_wait_seconds"] = metrics["wait_seconds"] / metrics["granted"] if metrics["granted"] else 0.0
+        return {
+            "rate": NAUKRI_RATE,
+            "burst": NAUKRI_BURST,
+            "shared": isinstance(self.bucket, SqliteTokenBucket),
+            "queue_depth": sum(metrics["queued"] for metrics in classes.values()),
+            "classes": classes,
+        }
+
+
+def make_naukri_bucket():
+    if NAUKRI_RATE <= 0:
+        return None
+    if NAUKRI_RATE_DB:
+        return SqliteTokenBucket(NAUKRI_RATE_DB, "naukri", NAUKRI_RATE, NAUKRI_BURST)
+    return TokenBucket(NAUKRI_RATE, NAUKRI_BURST)
+
+
+# Every request to Naukri (search pages and job details, either backend) takes a token here.
+NAUKRI_RATE_LIMITER = PriorityRateLimiter(make_naukri_bucket())
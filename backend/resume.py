@@ -1,22 +1,9 @@
 import time
 import re
-import spacy
 import PyPDF2
 from collections import Counter
 
-# Caching the NLP model globally for efficiency
-nlp = None
-
-def load_spacy_model():
-    global nlp
-    if nlp is None:
-        try:
-            nlp = spacy.load("en_core_web_sm")
-        except:
-            import subprocess
-            subprocess.check_call(["python", "-m", "spacy", "download", "en_core_web_sm"])
-            nlp = spacy.load("en_core_web_sm")
-    return nlp
+from skill_matcher import get_skill_matcher
 
 
 def extract_text_from_pdf(pdf_path):
@@ -29,10 +16,6 @@ def extract_text_from_pdf(pdf_path):
         return ""
 
 
-def preprocess_text(text):
-    return re.sub(r'[\W_]+', ' ', text.lower()).strip()
-
-
 def load_common_skills():
     """Load a list of common technical and soft skills."""
     technical_skills = [
@@ -70,28 +53,14 @@ def load_common_skills():
     return technical_skills + soft_skills
 
 
-def extract_skills_with_spacy(text):
-    nlp = load_spacy_model()
-    doc = nlp(text)
-    return set(
-        chunk.text.lower().strip() for chunk in doc.noun_chunks if 1 <= len(chunk.text.split()) <= 3
-    )
-
-
 def extract_skill_sections(text):
     patterns = [r'(skills|technologies|competencies).*?(\n\n|$)']
     return re.findall('|'.join(patterns), text, re.IGNORECASE | re.DOTALL)
 
 
 def extract_skills(text, common_skills):
-    found_skills = set()
-    words = set(text.split())
-    found_skills.update(skill for skill in common_skills if skill in words)
-
-    potential_skills = extract_skills_with_spacy(text)
-    found_skills.update(skill for skill in common_skills if any(skill in ps for ps in potential_skills))
-
-    return sorted(found_skills)
+    # One pass over the text with a trie compiled once per vocabulary; matches whole tokens only
+    return sorted(get_skill_matcher(common_skills).find(text))
 
 
 def extract_resume_skills(pdf_path):
@@ -100,7 +69,7 @@ def extract_resume_skills(pdf_path):
         print("No text found in the PDF.")
         return []
 
-    text = preprocess_text(text)
+    # The matcher tokenizes itself; stripping punctuation first would turn "c++" into "c"
     common_skills = load_common_skills()
     skills = extract_skills(text, common_skills)
     return skills
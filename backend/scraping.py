@@ -0,0 +1,377 @@
+import os
+import sqlite3
+import time
+from concurrent.futures import ThreadPoolExecutor, wait
+
+from cache import TieredCache
+from delay_policy import parse_delay_policy
+from driver_pool import DriverPool
+from job_store import JobStore, normalize_url
+from naukri_http import HttpScrapeError, get_shared_scraper
+from rate_limit import INTERACTIVE, NAUKRI_RATE_LIMITER, RateLimitTimeout
+from singleflight import SingleFlight
+
+# ========== CONFIG ==========
+
+# "http" (browserless, falls back to Selenium on failure), "selenium", or "http-only"
+SCRAPER_BACKEND = os.environ.get("SCRAPER_BACKEND", "http")
+NAUKRI_BASE_URL = os.environ.get("NAUKRI_BASE_URL", "https://www.naukri.com")
+
+SCRAPER_POOL_SIZE = int(os.environ.get("SCRAPER_POOL_SIZE", "2"))
+SCRAPER_MAX_USES = int(os.environ.get("SCRAPER_MAX_USES", "25"))
+SCRAPER_PAGE_WORKERS = int(os.environ.get("SCRAPER_PAGE_WORKERS", str(SCRAPER_POOL_SIZE)))
+# Gaps between Selenium page loads: "adaptive", "none", "fixed:<seconds>" or "jittered:<low>,<high>"
+SCRAPER_DELAY_POLICY = os.environ.get("SCRAPER_DELAY_POLICY", "adaptive")
+
+BACKENDS = ("http", "selenium", "http-only")
+
+SCRAPE_CACHE_TTL = float(os.environ.get("SCRAPE_CACHE_TTL", "3600"))
+SCRAPE_CACHE_SIZE = int(os.environ.get("SCRAPE_CACHE_SIZE", "256"))
+# Set to an empty string to keep the cache in memory only
+SCRAPE_CACHE_DB = os.environ.get("SCRAPE_CACHE_DB", "scrape_cache.sqlite3")
+# How long a request waits on an identical scrape already in flight before giving up
+SCRAPE_COALESCE_TIMEOUT = float(os.environ.get("SCRAPE_COALESCE_TIMEOUT", "120"))
+
+# Every scraped job is kept here, keyed by URL; set to an empty string to disable
+JOB_STORE_DB = os.environ.get("JOB_STORE_DB", "jobs.sqlite3")
+JOBS_PER_PAGE = 20
+
+# Searches run at once by run_fanout (each one also fetches its pages concurrently)
+FANOUT_WORKERS = int(os.environ.get("FANOUT_WORKERS", "8"))
+
+# ========== SELENIUM DRIVER POOL ==========
+
+def _create_driver():
+    # Imported here so the HTTP backend never pays for loading Selenium.
+    import naukri_scrapper as naukri
+    return naukri.create_driver(headless=True, disable_images=True)
+
+driver_pool = DriverPool(_create_driver, size=SCRAPER_POOL_SIZE, max_uses=SCRAPER_MAX_USES)
+
+# One policy for every pooled scrape, so an adaptive policy's view of Naukri's
+# response times survives from one page (and one request) to the next
+delay_policy = parse_delay_policy(SCRAPER_DELAY_POLICY)
+
+# ========== RESULT CACHE ==========
+
+scrape_cache = TieredCache(
+    ttl=SCRAPE_CACHE_TTL,
+    max_entries=SCRAPE_CACHE_SIZE,
+    db_path=SCRAPE_CACHE_DB or None,
+    namespace="naukri"
+)
+
+# Identical searches running at the same time share one scrape
+scrape_flights = SingleFlight(timeout=SCRAPE_COALESCE_TIMEOUT)
+
+def search_key(keyword, location=None, experience=None, pages=3, fetch_details=False):
+    # Normalised so "Data Scientist"/"data scientist " and 2/"2" share an entry
+    return TieredCache.make_key(
+        keyword.strip().lower(),
+        (location or "").strip().lower(),
+        "" if experience is None else str(experience).strip(),
+        int(pages),
+        bool(fetch_details)
+    )
+
+# ========== JOB STORE ==========
+
+job_store = JobStore(JOB_STORE_DB) if JOB_STORE_DB else None
+
+def listing_key(keyword, location=None, experience=None):
+    # A search's stored results don't depend on how many pages one crawl fetched
+    return TieredCache.make_key(
+        keyword.strip().lower(),
+        (location or "").strip().lower(),
+        "" if experience is None else str(experience).strip()
+    )
+
+def store_jobs(listing, jobs, offset=0):
+    """Upsert scraped jobs; a store failure never fails the scrape itself."""
+    if job_store is None or not jobs:
+        return
+    try:
+        job_store.upsert(jobs, search=listing, offset=offset)
+    except sqlite3.Error as e:
+        print(f"Error storing scraped jobs: {e}")
+
+# ========== BACKENDS ==========
+
+# `priority` is a rate_limit priority class: interactive scrapes take the shared
+# Naukri rate budget ahead of background ones (precrawl.py)
+
+def scrape_with_selenium(keyword, location=None, experience=None, pages=3, fetch_details=False, priority=INTERACTIVE):
+    import naukri_scrapper as naukri
+    return naukri.scrape_pages_concurrently(
+        driver_pool,
+        keyword=keyword,
+        location=location,
+        experience=experience,
+        pages=pages,
+        fetch_details=fetch_details,
+        workers=SCRAPER_PAGE_WORKERS,
+        priority=priority,
+        delay_policy=delay_policy
+    )
+
+def iter_with_selenium(keyword, location=None, experience=None, pages=3, fetch_details=False, workers=None,
+                       priority=INTERACTIVE, start=1):
+    import naukri_scrapper as naukri
+    return naukri.iter_pages_concurrently(
+        driver_pool,
+        keyword=keyword,
+        location=location,
+        experience=experience,
+        pages=pages,
+        fetch_details=fetch_details,
+        workers=workers or SCRAPER_PAGE_WORKERS,
+        priority=priority,
+        start=start,
+        delay_policy=delay_policy
+    )
+
+def iter_with_http(keyword, location=None, experience=None, pages=3, fetch_details=False, workers=None,
+                   priority=INTERACTIVE, start=1):
+    return get_shared_scraper(NAUKRI_BASE_URL).iter_pages(
+        keyword, location, experience, pages, fetch_details, workers, priority, start
+    )
+
+def scrape_with_http(keyword, location=None, experience=None, pages=3, fetch_details=False, priority=INTERACTIVE):
+    return get_shared_scraper(NAUKRI_BASE_URL).run_scraper(keyword, location, experience, pages, fetch_details, priority)
+
+def run_scraper(keyword, location=None, experience=None, pages=3, fetch_details=False, backend=None, use_cache=True,
+                incremental=False, refresh=False, priority=INTERACTIVE):
+    """Scrape Naukri (or answer from the cache) with the selected backend.
+
+    With `incremental`, pagination stops at the first page whose jobs are all in
+    the job store already, and the rest of the results come from the store. Page
+    1 is fetched on its own; if it has new jobs, the rest are fetched concurrently.
+    `refresh` always scrapes, then replaces the cached entry (used by precrawl.py).
+
+    A call for a search that is already being scraped at the same priority waits
+    for that scrape and shares its result (TimeoutError after
+    SCRAPE_COALESCE_TIMEOUT seconds). Priorities don't share a flight: an
+    interactive call joining a background scrape would wait at background priority.
+    """
+    backend = backend or SCRAPER_BACKEND
+    if backend not in BACKENDS:
+        raise ValueError(f"Unknown scraper backend '{backend}'. Expected one of: {', '.join(BACKENDS)}")
+
+    key = search_key(keyword, location, experience, pages, fetch_details)
+    if use_cache and not refresh:
+        jobs = scrape_cache.get(key)
+        if jobs is not None:
+            return jobs
+    return scrape_flights.do(
+        (key, priority), _run_scraper, keyword, location, experience, pages, fetch_details, backend, use_cache, incremental,
+        refresh, priority
+    )
+
+def _run_scraper(keyword, location, experience, pages, fetch_details, backend, use_cache, incremental, refresh,
+                 priority):
+    if refresh:
+        jobs = _run_scraper(keyword, location, experience, pages, fetch_details, backend, False, incremental, False,
+                            priority)
+        if use_cache and jobs:
+            scrape_cache.set(search_key(keyword, location, experience, pages, fetch_details), jobs)
+        return jobs
+
+    if use_cache:
+        # The previous flight for this key may have finished between run_scraper's lookup and this one starting
+        jobs = scrape_cache.get(search_key(keyword, location, experience, pages, fetch_details))
+        if jobs is not None:
+            return jobs
+
+    if incremental and job_store is not None:
+        return [
+            job for _, jobs in iter_scraper(
+                keyword, location, experience, pages, fetch_details, backend, use_cache, True, priority
+            )
+            for job in jobs
+        ]
+
+    jobs = _scrape(keyword, location, experience, pages, fetch_details, backend, priority)
+    store_jobs(listing_key(keyword, location, experience), jobs)
+    # An empty list usually means the scrape failed; don't pin that for a whole TTL
+    if use_cache and jobs:
+        scrape_cache.set(search_key(keyword, location, experience, pages, fetch_details), jobs)
+    return jobs
+
+def _scrape(keyword, location, experience, pages, fetch_details, backend, priority=INTERACTIVE):
+    """Scrape Naukri with the selected backend, falling back to Selenium when HTTP fails.
+
+    RateLimitTimeout propagates: Selenium waits on the same limiter, so it is no fallback.
+    """
+    if backend == "selenium":
+        return scrape_with_selenium(keyword, location, experience, pages, fetch_details, priority)
+
+    try:
+        return scrape_with_http(keyword, location, experience, pages, fetch_details, priority)
+    except HttpScrapeError as e:
+        if backend == "http-only":
+            raise
+        print(f"HTTP scrape failed ({e}); falling back to Selenium")
+        return scrape_with_selenium(keyword, location, experience, pages, fetch_details, priority)
+
+def iter_scraper(keyword, location=None, experience=None, pages=3, fetch_details=False, backend=None, use_cache=True,
+                 incremental=False, priority=INTERACTIVE):
+    """Generator form of run_scraper: yields (page_number, jobs) as each page is ready.
+
+    A cache hit is yielded as a single page 1 holding every cached job. When an
+    incremental crawl stops early, the stored results it skipped are yielded as
+    one last page.
+    """
+    backend = backend or SCRAPER_BACKEND
+    if backend not in BACKENDS:
+        raise ValueError(f"Unknown scraper backend '{backend}'. Expected one of: {', '.join(BACKENDS)}")
+
+    key = search_key(keyword, location, experience, pages, fetch_details)
+    if use_cache:
+        jobs = scrape_cache.get(key)
+        if jobs is not None:
+            yield 1, jobs
+            return
+
+    incremental = incremental and job_store is not None
+    listing = listing_key(keyword, location, experience)
+    all_jobs = []
+    crawl = {"stopped_at": None, "started": False}
+
+    def pages_from(pages_iter):
+        try:
+            for page, jobs in pages_iter:
+                crawl["started"] = True
+                if incremental:
+                    urls = {normalize_url(job["url"]) for job in jobs}
+                    # Known to this search, not just to the store: the rest of the results
+                    # come from this search's stored listing, which another search doesn't fill
+                    only_known = not (urls - job_store.known_urls(urls, search=listing))
+                store_jobs(listing, jobs, offset=len(all_jobs))
+                all_jobs.extend(jobs)
+                yield page, jobs
+                if incremental and only_known:
+                    # Results are newest first, so every later page is known too
+                    crawl["stopped_at"] = page
+                    return
+        finally:
+            pages_iter.close()
+
+    def crawl_pages(iterate):
+        if not incremental:
+            yield from pages_from(iterate(keyword, location, experience, pages, fetch_details, None, priority))
+            return
+        # Page 1 alone decides whether anything is new; if so, the rest go concurrently
+        yield from pages_from(iterate(keyword, location, experience, 1, fetch_details, None, priority))
+        if crawl["stopped_at"] is None and pages > 1:
+            yield from pages_from(iterate(keyword, location, experience, pages, fetch_details, None, priority, start=2))
+
+    try:
+        yield from crawl_pages(iter_with_selenium if backend == "selenium" else iter_with_http)
+    except RateLimitTimeout as e:
+        # Not a backend failure: Selenium would wait on the same limiter. Don't cache a partial listing.
+        print(f"{e}; stopping after {len(all_jobs)} jobs")
+        return
+    except HttpScrapeError as e:
+        # Pages already streamed can't be taken back, so only fall back before the first one
+        if backend == "http-only" or crawl["started"]:
+            print(f"HTTP scrape failed ({e}); stopping after {len(all_jobs)} jobs")
+            return
+        print(f"HTTP scrape failed ({e}); falling back to Selenium")
+        yield from crawl_pages(iter_with_selenium)
+
+    if crawl["stopped_at"] is not None and crawl["stopped_at"] < pages:
+        seen = {normalize_url(job["url"]) for job in all_jobs}
+        stored = [job for job in job_store.search_results(listing) if normalize_url(job["url"]) not in seen]
+        stored = stored[:pages * JOBS_PER_PAGE - len(all_jobs)]
+        if stored:
+            all_jobs.extend(stored)
+            yield crawl["stopped_at"] + 1, stored
+
+    if use_cache and all_jobs:
+        scrape_cache.set(key, all_jobs)
+
+# ========== FAN-OUT ==========
+
+fanout_executor = ThreadPoolExecutor(max_workers=FANOUT_WORKERS, thread_name_prefix="fanout")
+
+def run_fanout(keywords, locations, experience=None, pages=3, time_budget=None, **kwargs):
+    """Run every (keyword, location) search concurrently and merge the results.
+
+    `keywords` are in rank order (best first). Listings are deduplicated by URL and
+    ranked by their position in their own search, then by keyword rank, then by
+    location order, so every keyword's top results come before anyone's second
+    page. Each listing is tagged with the best-ranked search that returned it
+    (source_title, source_location) and every title that did (source_titles).
+
+    Searches still running after `time_budget` seconds are left out of this
+    result but keep running, so their listings land in the cache for next time.
+    Searches that haven't started by then are cancelled ("cancelled") rather than
+    left queued ahead of later uploads; precrawl.py refreshes them in the background.
+    Other keyword arguments go to run_scraper.
+
+    Returns {"jobs": [...], "searches": [{"title", "location", "status", "jobs"}], "seconds": ...}.
+    """
+    started = time.perf_counter()
+    searches = [(keyword, location) for keyword in keywords for location in locations]
+    futures = [
+        fanout_executor.submit(run_scraper, keyword, location, experience, pages, **kwargs)
+        for keyword, location in searches
+    ]
+    wait(futures, timeout=time_budget)
+    for future in futures:
+        future.cancel()
+
+    ranked = {}
+    summary = []
+    for search_index, ((keyword, location), future) in enumerate(zip(searches, futures)):
+        title_rank, location_rank = divmod(search_index, len(locations))
+        status = "ok"
+        jobs = []
+        if future.cancelled():
+            status = "cancelled"
+        elif not future.done():
+            status = "timeout"
+        elif future.exception() is not None:
+            status = "error"
+            print(f"Fan-out scrape for '{keyword}' in {location} failed: {future.exception()}")
+        else:
+            jobs = future.result()
+        summary.append({"title": keyword, "location": location, "status": status, "jobs": len(jobs)})
+
+        for position, job in enumerate(jobs):
+            url = normalize_url(job["url"])
+            rank = (position, title_rank, location_rank)
+            entry = ranked.get(url)
+            if entry is None:
+                ranked[url] = entry = {"rank": rank, "job": job, "titles": []}
+            elif rank < entry["rank"]:
+                entry["rank"], entry["job"] = rank, job
+            if keyword not in entry["titles"]:
+                entry["titles"].append(keyword)
+
+    merged = []
+    for entry in sorted(ranked.values(), key=lambda entry: entry["rank"]):
+        _, title_rank, location_rank = entry["rank"]
+        merged.append(dict(
+            entry["job"],
+            source_title=keywords[title_rank],
+            source_location=locations[location_rank],
+            source_titles=entry["titles"]
+        ))
+    return {"jobs": merged, "searches": summary, "seconds": time.perf_counter() - started}
+
+def stats():
+    return {
+        "cache": scrape_cache.stats(),
+        "driver_pool": driver_pool.stats(),
+        "job_store": job_store.stats() if job_store is not None else None,
+        "rate_limiter": NAUKRI_RATE_LIMITER.stats(),
+        "coalescing": scrape_flights.stats()
+    }
+
+def close():
+    fanout_executor.shutdown(wait=False, cancel_futures=True)
+    driver_pool.close()
+    scrape_cache.close()
+    if job_store is not None:
+        job_store.close()
@@ -0,0 +1,63 @@
+import copy
+import threading
+from concurrent.futures import Future, TimeoutError as FutureTimeout
+
+
+class SingleFlight:
+    """Runs at most one call per key at a time; concurrent callers with that key share its outcome.
+
+    The first caller (the leader) runs the function on its own thread. Callers
+    arriving while it runs (followers) wait on the leader's future instead of
+    repeating the work, and get a deep copy of its result or its exception. A
+    follower that times out only stops waiting: the leader keeps running and its
+    result still reaches every other follower. The key is released when the
+    leader finishes, so later calls start a fresh flight.
+    """
+
+    def __init__(self, timeout=None):
+        self.timeout = timeout
+        self._flights = {}
+        self._lock = threading.Lock()
+        self.counters = {"leaders": 0, "coalesced": 0, "timeouts": 0, "errors": 0}
+
+    def do(self, key, fn, *args, timeout=None, **kwargs):
+        """fn(*args, **kwargs), or the result of an identical call already in flight.
+
+        Followers raise TimeoutError after `timeout` seconds (default: self.timeout).
+        """
+        with self._lock:
+            future = self._flights.get(key)
+            leader = future is None
+            if leader:
+                future = self._flights[key] = Future()
+                self.counters["leaders"] += 1
+            else:
+                self.counters["coalesced"] += 1
+
+        if leader:
+            try:
+                result = fn(*args, **kwargs)
+            except BaseException as e:
+                future.set_exception(e)
+                self._count("errors")
+                raise
+            else:
+                future.set_result(result)
+                return result
+            finally:
+                with self._lock:
+                    del self._flights[key]
+
+        try:
+            return copy.deepcopy(future.result(self.timeout if timeout is None else timeout))
+        except FutureTimeout:
+            self._count("timeouts")
+            raise TimeoutError(f"Timed out waiting for in-flight call {key}") from None
+
+    def _count(self, name):
+        with self._lock:
+            self.counters[name] += 1
+
+    def stats(self):
+        with self._lock:
+            return dict(self.counters, in_flight=len(self._flights))
@@ -0,0 +1,95 @@
+import re
+from functools import lru_cache
+
+# A token is a run of letters/digits that may carry symbol suffixes ("c++", "c#")
+# and dotted parts ("node.js", "asp.net"). Everything else separates tokens, so
+# "r" never matches inside "react" and "java" never matches inside "javascript".
+TOKEN_RE = re.compile(r"[a-z0-9][a-z0-9+#]*(?:\.[a-z0-9]+)*[+#]*")
+
+# Punctuation inside a skill name that resumes often write as a space instead
+# ("React JS", "CI CD"), or that preprocess_text() has already stripped.
+_INNER_PUNCT_RE = re.compile(r"(?<=[a-z0-9])[./\-](?=[a-z0-9])")
+
+_END = object()
+
+
+def tokenize(text):
+    return TOKEN_RE.findall(text.lower())
+
+
+def flatten_text(text):
+    """Lower-cased text on one line, inner punctuation as spaces ("Problem-\nSolving" -> "problem solving").
+
+    For matchers that compare token sequences without tokenize() (spaCy's PhraseMatcher).
+    """
+    return " ".join(_INNER_PUNCT_RE.sub(" ", text.lower()).split())
+
+
+def skill_variants(skill):
+    """Token sequences that count as a mention of `skill`."""
+    variants = {tuple(tokenize(skill))}
+    variants.add(tuple(tokenize(_INNER_PUNCT_RE.sub(" ", skill.lower()))))
+    return [v for v in variants if v]
+
+
+class SkillMatcher:
+    """Token trie over a skill vocabulary.
+
+    find() walks the resume's tokens once; at each position it follows the trie
+    as far as the text allows, so multi-word skills ("machine learning") are
+    found in the same pass as single-word ones. Skills are reported in the
+    spelling they have in the vocabulary.
+    """
+
+    def __init__(self, skills):
+        self.skills = list(skills)
+        self.root = {}
+        self.max_len = 0
+        for skill in self.skills:
+            for tokens in skill_variants(skill):
+                node = self.root
+                for token in tokens:
+                    node = node.setdefault(token, {})
+                node[_END] = skill
+                self.max_len = max(self.max_len, len(tokens))
+
+    def find_in_tokens(self, tokens):
+        found = set()
+        root = self.root
+        for start in range(len(tokens)):
+            node = root
+            for token in tokens[start:start + self.max_len]:
+                node = node.get(token)
+                if node is None:
+                    break
+                skill = node.get(_END)
+                if skill is not None:
+                    found.add(skill)
+        return found
+
+    def find(self, text):
+        return self.find_in_tokens(tokenize(text))
+
+    def find_in_texts(self, texts):
+        """find() over text arriving in pieces (e.g. PDF pages), without joining it first.
+
+        The last max_len - 1 tokens of each piece are carried into the next, so a
+        multi-word skill split across two pieces is still found.
+        """
+        found = set()
+        carry = []
+        for text in texts:
+            tokens = carry + tokenize(text)
+            found |= self.find_in_tokens(tokens)
+            carry = tokens[len(tokens) - self.max_len + 1:] if self.max_len > 1 else []
+        return found
+
+
+@lru_cache(maxsize=16)
+def _compiled(skills):
+    return SkillMatcher(skills)
+
+
+def get_skill_matcher(skills):
+    """Compiled matcher for a vocabulary; built once per distinct vocabulary."""
+    return _compiled(tuple(skills))
@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""Local stand-in for Naukri's JSON search/detail endpoints.
+
+Serves deterministic fake listings so the HTTP scraping backend (and anything
+built on it) can be exercised without touching naukri.com:
+
+    python standin_server.py --port 8765
+    NAUKRI_BASE_URL=http://127.0.0.1:8765 python -m uvicorn main:app
+"""
+
+import argparse
+import json
+import threading
+import time
+import zlib
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlparse, parse_qs
+
+RESULTS_PER_PAGE = 20
+TOTAL_PAGES = 5
+
+
+def _job_id(keyword, location, page, index):
+    seed = zlib.crc32(f"{keyword.lower()}|{(location or '').lower()}".encode()) % 10**8
+    return f"{seed:08d}{page:02d}{index:02d}"
+
+
+def fake_search_page(keyword, location=None, page=1):
+    if page > TOTAL_PAGES:
+        return {"jobDetails": [], "noOfJobs": TOTAL_PAGES * RESULTS_PER_PAGE}
+    jobs = []
+    for index in range(RESULTS_PER_PAGE):
+        job_id = _job_id(keyword, location, page, index)
+        jobs.append({
+            "jobId": job_id,
+            "title": f"{keyword} {page}-{index}",
+            "companyName": f"Company {index % 7}",
+            "jdURL": f"/job-listings-{job_id}",
+            "placeholders": [
+                {"type": "experience", "label": f"{index % 5}-{index % 5 + 3} Yrs"},
+                {"type": "salary", "label": "Not disclosed"},
+                {"type": "location", "label": location or "Remote"},
+            ],
+            "jobDescription": f"<p>Work on {keyword.lower()} systems.</p>",
+            "footerPlaceholderLabel": f"{index % 10} Days Ago",
+            "tagsAndSkills": "python,sql,git",
+        })
+    return {"jobDetails": jobs, "noOfJobs": TOTAL_PAGES * RESULTS_PER_PAGE}
+
+
+def fake_job_details(job_id):
+    return {"jobDetails": {
+        "description": f"<p>Full description for job {job_id}.</p>",
+        "roleCategory": "Software Development",
+        "companyDetail": {"details": "<p>A stand-in company.</p>"},
+        "keySkills": {"preferred": [{"label": "python"}], "other": [{"label": "sql"}, {"label": "git"}]},
+    }}
+
+
+class StandinHandler(BaseHTTPRequestHandler):
+    latency = 0.0
+
+    def _send_json(self, payload, status=200):
+        body = json.dumps(payload).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        if self.latency:
+            time.sleep(self.latency)
+        url = urlparse(self.path)
+        query = {k: v[0] for k, v in parse_qs(url.query).items()}
+        if url.path == "/jobapi/v3/search":
+            self._send_json(fake_search_page(query.get("keyword", ""), query.get("location"), int(query.get("pageNo", 1))))
+        elif url.path.startswith("/jobapi/v4/job/"):
+            self._send_json(fake_job_details(url.path.rsplit("/", 1)[-1]))
+        else:
+            self._send_json({"message": "not found"}, status=404)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def start_standin_server(host="127.0.0.1", port=0, latency=0.0):
+    """Start the server on a background thread; returns (server, base_url)."""
+    handler = type("Handler", (StandinHandler,), {"latency": latency})
+    server = ThreadingHTTPServer((host, port), handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, f"http://{host}:{server.server_address[1]}"
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--latency", type=float, default=0.0, help="seconds to delay every response")
+    args = parser.parse_args()
+    server, base_url = start_standin_server(args.host, args.port, args.latency)
+    print(f"Stand-in Naukri server running at {base_url}")
+    try:
+        threading.Event().wait()
+    except KeyboardInterrupt:
+        server.shutdown()
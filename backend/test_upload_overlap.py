@@ -0,0 +1,32 @@
+import json
+import os
+import subprocess
+import sys
+
+BACKEND = os.path.dirname(os.path.abspath(__file__))
+PDF = os.path.join(BACKEND, "uploads", "Resume.pdf")
+
+# The bench sets the app's config through environment variables and imports main,
+# so it runs in its own interpreter and none of that leaks into other tests.
+SCRIPT = """
+import json, sys
+import bench
+print(json.dumps(bench.bench_upload_overlap(sys.argv[1], concurrency=int(sys.argv[2]), latency=0.5)))
+"""
+
+
+def test_concurrent_uploads_overlap():
+    concurrency = 4
+    # One search per upload, so the HTTP client's connection limit doesn't cap the overlap
+    env = dict(os.environ, NAUKRI_TOP_K="1")
+    result = subprocess.run(
+        [sys.executable, "-c", SCRIPT, PDF, str(concurrency)],
+        cwd=BACKEND, env=env, capture_output=True, text=True, timeout=300
+    )
+    assert result.returncode == 0, result.stderr
+    overlap, loop_lag = json.loads(result.stdout.strip().splitlines()[-1])
+
+    # Fully serialised uploads give 1.0x
+    assert overlap >= concurrency / 2
+    # Parsing or matching a resume on the event loop stalls /healthz for the whole stage
+    assert loop_lag < 0.1